@@ -13,7 +13,7 @@ import shutil
 import logging
 import platform
 import subprocess
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterable
 from pathlib import Path
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -22,12 +22,21 @@ from urllib.request import urlopen
 from urllib.error import URLError
 
 from dotenv import load_dotenv
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm
 from rich.logging import RichHandler
 
+# Config parsing uses orjson when installed (a faster, Rust-based JSON library
+# that reads bytes directly); saving always uses json, since orjson can only
+# indent by 2 and config.json is written with 4-space indents
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment
 load_dotenv()
 
@@ -41,6 +50,13 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
+# Platform probes (resolved once at import)
+SYSTEM = platform.system()
+IS_DARWIN = SYSTEM == "Darwin"
+IS_WINDOWS = SYSTEM == "Windows"
+IS_LINUX = SYSTEM == "Linux"
+IN_VENV = sys.prefix != sys.base_prefix
+
 
 @dataclass
 class BrowserTestResult:
@@ -53,9 +69,42 @@ class BrowserTestResult:
     driver_version: Optional[str] = None
 
 
+def _netcheck_ttl(default: float = 60.0) -> float:
+    """Read PC_AGENT_NETCHECK_TTL, falling back to the default if it isn't a number"""
+    value = os.getenv("PC_AGENT_NETCHECK_TTL")
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid PC_AGENT_NETCHECK_TTL={value!r}, using {default:g}s")
+        return default
+
+
 class NetworkChecker:
     """Check network connectivity before automation"""
     
+    # Last successful check is recorded here so repeated runs can skip the probe
+    CACHE_PATH = Path.home() / ".cache" / "pc_agent" / "netcheck"
+    CACHE_TTL = _netcheck_ttl()
+    
+    @classmethod
+    def recently_ok(cls) -> bool:
+        """Check if a successful network check was recorded within the TTL"""
+        try:
+            return time.time() - cls.CACHE_PATH.stat().st_mtime < cls.CACHE_TTL
+        except OSError:
+            return False
+    
+    @classmethod
+    def mark_ok(cls) -> None:
+        """Record a successful network check"""
+        try:
+            cls.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            cls.CACHE_PATH.touch()
+        except OSError as e:
+            logger.debug(f"Could not update network check cache: {e}")
+    
     @staticmethod
     def check_internet(timeout: int = 5) -> bool:
         """Check if internet connection is available"""
@@ -81,7 +130,18 @@ class BrowserDetector:
     """Detect available browsers on the system"""
     
     @staticmethod
-    def find_chrome() -> bool:
+    def _any_exists(paths: Iterable[str]) -> bool:
+        """Return True on the first path that stats successfully"""
+        for path in paths:
+            try:
+                os.stat(path)
+                return True
+            except OSError:
+                continue
+        return False
+    
+    @classmethod
+    def find_chrome(cls) -> bool:
         """Find Chrome browser"""
         # Try shutil.which first (most reliable)
         if shutil.which("google-chrome") or shutil.which("chrome"):
@@ -107,10 +167,10 @@ class BrowserDetector:
             str(home / ".local" / "bin" / "google-chrome")
         ])
         
-        return any(os.path.exists(path) for path in chrome_paths)
+        return cls._any_exists(chrome_paths)
     
-    @staticmethod
-    def find_firefox() -> bool:
+    @classmethod
+    def find_firefox(cls) -> bool:
         """Find Firefox browser"""
         if shutil.which("firefox"):
             return True
@@ -123,18 +183,18 @@ class BrowserDetector:
             "C:/Program Files (x86)/Mozilla Firefox/firefox.exe"
         ]
         
-        return any(os.path.exists(path) for path in firefox_paths)
+        return cls._any_exists(firefox_paths)
     
     @staticmethod
     def find_safari() -> bool:
         """Find Safari browser (macOS only)"""
-        if platform.system() != "Darwin":
+        if not IS_DARWIN:
             return False
         
         return os.path.exists("/Applications/Safari.app")
     
-    @staticmethod
-    def find_edge() -> bool:
+    @classmethod
+    def find_edge(cls) -> bool:
         """Find Edge browser"""
         if shutil.which("microsoft-edge"):
             return True
@@ -147,7 +207,7 @@ class BrowserDetector:
             "C:/Program Files/Microsoft/Edge/Application/msedge.exe"
         ]
         
-        return any(os.path.exists(path) for path in edge_paths)
+        return cls._any_exists(edge_paths)
     
     @classmethod
     def detect_all_browsers(cls) -> List[Tuple[str, str, bool]]:
@@ -162,7 +222,7 @@ class BrowserDetector:
         ]
         
         # Add Safari for macOS
-        if platform.system() == "Darwin":
+        if IS_DARWIN:
             browsers.append(("safari", "Safari (requires configuration)", cls.find_safari()))
         
         return browsers
@@ -211,8 +271,7 @@ class ConfigManager:
         """Load configuration with error handling"""
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+                return _json_loads(Path(config_path).read_bytes())
             else:
                 logger.warning(f"Config file {config_path} not found, using defaults")
                 return ConfigManager.get_default_config()
@@ -237,11 +296,17 @@ class ConfigManager:
         }
     
     @staticmethod
-    def save_config(config: Dict[str, Any], config_path: str = "config.json") -> bool:
-        """Save configuration safely with backup"""
+    def save_config(config: Dict[str, Any], config_path: str = "config.json",
+                    backup: bool = False) -> bool:
+        """
+        Save configuration safely
+        
+        The temp-file + os.replace pattern already leaves the original intact
+        until the rename, so the extra .backup copy is only made on request.
+        """
         try:
-            # Create backup if file exists
-            if os.path.exists(config_path):
+            # Create backup only when explicitly requested
+            if backup and os.path.exists(config_path):
                 backup_path = f"{config_path}.backup"
                 shutil.copy2(config_path, backup_path)
                 logger.info(f"Created backup: {backup_path}")
@@ -274,13 +339,36 @@ class BrowserAutomationTester:
     """Test browser automation with proper cleanup"""
     
     @staticmethod
-    def test_browser(browser_type: str, headless: bool = False) -> BrowserTestResult:
+    def create_driver(browser_type: str, headless: bool = False):
+        """Create a WebDriver for the given browser type"""
+        if browser_type == "chrome":
+            driver = BrowserAutomationTester._setup_chrome(headless)
+        elif browser_type == "firefox":
+            driver = BrowserAutomationTester._setup_firefox(headless)
+        elif browser_type == "safari":
+            driver = BrowserAutomationTester._setup_safari()
+        elif browser_type == "edge":
+            driver = BrowserAutomationTester._setup_edge(headless)
+        else:
+            raise ValueError(f"Unsupported browser: {browser_type}")
+        
+        if not driver:
+            raise Exception("Failed to initialize WebDriver")
+        
+        console.print(f"✅ {browser_type.capitalize()} WebDriver initialized")
+        return driver
+    
+    @staticmethod
+    def test_browser(browser_type: str, headless: bool = False, driver=None) -> BrowserTestResult:
         """
         Test browser automation with comprehensive error handling
         
         Args:
             browser_type: Type of browser to test (chrome, firefox, safari, edge)
             headless: Run in headless mode
+            driver: Existing WebDriver to probe (e.g. from browser_session);
+                    it is left open. When omitted a fresh session is launched
+                    and closed after the test.
             
         Returns:
             BrowserTestResult with test outcome
@@ -289,14 +377,9 @@ class BrowserAutomationTester:
         
         # Check dependencies first
         try:
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
             from selenium.common.exceptions import (
                 WebDriverException,
-                TimeoutException,
-                NoSuchElementException
+                TimeoutException
             )
         except ImportError as e:
             return BrowserTestResult(
@@ -305,7 +388,6 @@ class BrowserAutomationTester:
                 error_message=f"Missing dependency: {e}. Install: pip install selenium"
             )
         
-        driver = None
         success = False
         error_msg = None
         title = None
@@ -313,53 +395,18 @@ class BrowserAutomationTester:
         driver_version = None
         
         try:
-            # Setup browser based on type
-            if browser_type == "chrome":
-                driver = BrowserAutomationTester._setup_chrome(headless)
-            elif browser_type == "firefox":
-                driver = BrowserAutomationTester._setup_firefox(headless)
-            elif browser_type == "safari":
-                driver = BrowserAutomationTester._setup_safari()
-            elif browser_type == "edge":
-                driver = BrowserAutomationTester._setup_edge(headless)
+            if driver is not None:
+                title, url, driver_version = BrowserAutomationTester._run_probe(driver)
             else:
-                raise ValueError(f"Unsupported browser: {browser_type}")
-            
-            if not driver:
-                raise Exception("Failed to initialize WebDriver")
-            
-            console.print(f"✅ {browser_type.capitalize()} WebDriver initialized")
-            
-            # Get driver version if available
-            try:
-                if hasattr(driver, 'capabilities'):
-                    caps = driver.capabilities
-                    driver_version = caps.get('browserVersion', 'unknown')
-            except Exception:
-                pass
-            
-            # Test navigation
-            console.print("🌐 Testing navigation to example.com...")
-            driver.get("https://example.com")
-            
-            # Wait for page to load
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            
-            # Get page info
-            title = driver.title
-            url = driver.current_url
-            
-            console.print(f"✅ Navigation successful!")
-            console.print(f"   Title: {title}")
-            console.print(f"   URL: {url}")
+                with browser_session(browser_type, headless) as session_driver:
+                    title, url, driver_version = BrowserAutomationTester._run_probe(session_driver)
+                    
+                    # Brief pause if not headless (let user see)
+                    if not headless:
+                        time.sleep(2)
             
             success = True
             
-            # Brief pause if not headless (let user see)
-            if not headless:
-                time.sleep(2)
-            
         except KeyboardInterrupt:
             error_msg = "Test interrupted by user"
             console.print(f"\n⚠️ {error_msg}")
@@ -378,15 +425,6 @@ class BrowserAutomationTester:
             console.print(f"❌ {error_msg}")
             logger.exception(f"{browser_type} test failed")
         
-        finally:
-            # CRITICAL: Always cleanup driver
-            if driver:
-                try:
-                    driver.quit()
-                    console.print("🧹 Browser closed")
-                except Exception as e:
-                    logger.warning(f"Driver cleanup warning: {e}")
-        
         return BrowserTestResult(
             browser_type=browser_type,
             success=success,
@@ -396,6 +434,43 @@ class BrowserAutomationTester:
             driver_version=driver_version
         )
     
+    @staticmethod
+    def _run_probe(driver, url: str = "https://example.com") -> Tuple[str, str, Optional[str]]:
+        """
+        Navigate an open driver and verify the page loads
+        Returns: (title, current_url, driver_version)
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        # Get driver version if available
+        driver_version = None
+        try:
+            if hasattr(driver, 'capabilities'):
+                caps = driver.capabilities
+                driver_version = caps.get('browserVersion', 'unknown')
+        except Exception:
+            pass
+        
+        # Test navigation
+        console.print(f"🌐 Testing navigation to {url}...")
+        driver.get(url)
+        
+        # Wait for page to load
+        wait = WebDriverWait(driver, 10)
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        
+        # Get page info
+        title = driver.title
+        current_url = driver.current_url
+        
+        console.print(f"✅ Navigation successful!")
+        console.print(f"   Title: {title}")
+        console.print(f"   URL: {current_url}")
+        
+        return title, current_url, driver_version
+    
     @staticmethod
     def _setup_chrome(headless: bool = False):
         """Setup Chrome with proper configuration"""
@@ -470,92 +545,128 @@ class BrowserAutomationTester:
         return webdriver.Edge(service=service, options=options)
 
 
+@contextmanager
+def browser_session(browser_type: str, headless: bool = False):
+    """
+    Launch one WebDriver and keep it open for the duration of the block
+    
+    Driver startup is the expensive part of a browser test, so callers
+    probing several URLs should share a session and pass the driver to
+    BrowserAutomationTester.test_browser instead of relaunching each time.
+    """
+    driver = BrowserAutomationTester.create_driver(browser_type, headless)
+    try:
+        yield driver
+    finally:
+        # CRITICAL: Always cleanup driver
+        try:
+            driver.quit()
+            console.print("🧹 Browser closed")
+        except Exception as e:
+            logger.warning(f"Driver cleanup warning: {e}")
+
+
 def display_system_status():
     """Display comprehensive system status"""
-    console.print(Panel.fit("🔍 System Status Check", style="bold cyan"))
-    
-    # Python version
-    console.print(f"🐍 Python: {sys.version.split()[0]}")
-    console.print(f"💻 OS: {platform.system()} {platform.machine()}")
+    # Output is collected and emitted in a few batched prints
+    out = [
+        f"🐍 Python: {sys.version.split()[0]}",
+        f"💻 OS: {SYSTEM} {platform.machine()}",
+    ]
     
     # Virtual environment
-    in_venv = sys.prefix != sys.base_prefix
-    venv_status = "✅ Active" if in_venv else "⚠️ Not active"
-    console.print(f"📦 Virtual Environment: {venv_status}")
+    venv_status = "✅ Active" if IN_VENV else "⚠️ Not active"
+    out.append(f"📦 Virtual Environment: {venv_status}")
     
-    if not in_venv:
-        console.print("   💡 Consider using: python -m venv venv")
+    if not IN_VENV:
+        out.append("   💡 Consider using: python -m venv venv")
     
     # Network check
-    console.print("\n🌍 Network Status:")
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Checking connectivity...", total=None)
-        network_ok = NetworkChecker.check_internet()
-        progress.remove_task(task)
+    out.append("\n🌍 Network Status:")
+    console.print(Group(
+        Panel.fit("🔍 System Status Check", style="bold cyan"),
+        "\n".join(out)
+    ))
+    
+    network_ok = NetworkChecker.recently_ok()
+    if not network_ok:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Checking connectivity...", total=None)
+            network_ok = NetworkChecker.check_internet()
+            progress.remove_task(task)
+        
+        if network_ok:
+            NetworkChecker.mark_ok()
     
     if network_ok:
-        console.print("   ✅ Internet connection active")
+        out = ["   ✅ Internet connection active"]
     else:
-        console.print("   ❌ No internet connection")
-        console.print("   ⚠️ WebDriver download may fail")
+        out = ["   ❌ No internet connection",
+               "   ⚠️ WebDriver download may fail"]
     
     # Selenium check
-    console.print("\n📚 Dependencies:")
+    out.append("\n📚 Dependencies:")
     selenium_ok, selenium_version, selenium_msg = SeleniumChecker.check_selenium()
     
     if selenium_ok:
-        console.print(f"   ✅ Selenium {selenium_version}")
+        out.append(f"   ✅ Selenium {selenium_version}")
     else:
-        console.print(f"   ❌ Selenium: {selenium_msg}")
-        console.print("      Install: pip install selenium")
+        out.append(f"   ❌ Selenium: {selenium_msg}")
+        out.append("      Install: pip install selenium")
     
     webdriver_manager_ok = SeleniumChecker.check_webdriver_manager()
     if webdriver_manager_ok:
-        console.print("   ✅ webdriver-manager installed")
+        out.append("   ✅ webdriver-manager installed")
     else:
-        console.print("   ❌ webdriver-manager not installed")
-        console.print("      Install: pip install webdriver-manager")
+        out.append("   ❌ webdriver-manager not installed")
+        out.append("      Install: pip install webdriver-manager")
+    
+    console.print("\n".join(out))
     
     return selenium_ok and webdriver_manager_ok and network_ok
 
 
 def run_smart_browser_detection():
     """Run intelligent browser detection and testing"""
-    console.print("\n" + "="*60)
-    console.print(Panel.fit("🚀 Smart Browser Detection & Testing", style="bold green"))
-    
     # Detect available browsers
     all_browsers = BrowserDetector.detect_all_browsers()
     
-    console.print("\n🌐 Browser Detection Results:")
+    out = ["\n🌐 Browser Detection Results:"]
     available_browsers = []
     
     for browser_type, description, available in all_browsers:
         status = "✅" if available else "❌"
-        console.print(f"   {status} {description}")
+        out.append(f"   {status} {description}")
         
         if available:
             available_browsers.append((browser_type, description))
     
     if not available_browsers:
-        console.print("\n❌ No browsers found!")
-        console.print("\n💡 Install Chrome (recommended):")
-        if platform.system() == "Darwin":
-            console.print("   brew install --cask google-chrome")
+        out.append("\n❌ No browsers found!")
+        out.append("\n💡 Install Chrome (recommended):")
+        if IS_DARWIN:
+            out.append("   brew install --cask google-chrome")
         else:
-            console.print("   https://www.google.com/chrome/")
-        return None
+            out.append("   https://www.google.com/chrome/")
+    else:
+        out.append(f"\n🎯 Found {len(available_browsers)} browser(s) available")
+        out.append("\n" + "="*60)
+        out.append("🧪 Testing Browser Automation...\n")
+    
+    console.print(Group(
+        "\n" + "="*60,
+        Panel.fit("🚀 Smart Browser Detection & Testing", style="bold green"),
+        "\n".join(out)
+    ))
     
-    console.print(f"\n🎯 Found {len(available_browsers)} browser(s) available")
+    if not available_browsers:
+        return None
     
     # Test each browser
-    console.print("\n" + "="*60)
-    console.print("🧪 Testing Browser Automation...\n")
-    
     for browser_type, description in available_browsers:
         console.print(f"🔧 Testing {description}...")
         
@@ -596,34 +707,45 @@ def run_smart_browser_detection():
 
 def show_installation_guide():
     """Show comprehensive installation guide"""
-    console.print(Panel.fit("📖 Installation & Setup Guide", style="bold blue"))
-    
-    console.print("\n🌐 Recommended: Google Chrome")
-    console.print("   ✅ Best compatibility and reliability")
-    console.print("   ✅ Automatic driver management")
-    console.print("   ✅ Works on all platforms")
-    
-    console.print("\n📥 Installation:")
-    
-    if platform.system() == "Darwin":  # macOS
-        console.print("   Option 1 (Homebrew - recommended):")
-        console.print("   $ brew install --cask google-chrome")
-        console.print("\n   Option 2 (Manual):")
-        console.print("   1. Visit https://www.google.com/chrome/")
-        console.print("   2. Download and install")
-    elif platform.system() == "Linux":
-        console.print("   Ubuntu/Debian:")
-        console.print("   $ wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb")
-        console.print("   $ sudo dpkg -i google-chrome-stable_current_amd64.deb")
+    out = [
+        "\n🌐 Recommended: Google Chrome",
+        "   ✅ Best compatibility and reliability",
+        "   ✅ Automatic driver management",
+        "   ✅ Works on all platforms",
+        "\n📥 Installation:",
+    ]
+    
+    if IS_DARWIN:  # macOS
+        out += [
+            "   Option 1 (Homebrew - recommended):",
+            "   $ brew install --cask google-chrome",
+            "\n   Option 2 (Manual):",
+            "   1. Visit https://www.google.com/chrome/",
+            "   2. Download and install",
+        ]
+    elif IS_LINUX:
+        out += [
+            "   Ubuntu/Debian:",
+            "   $ wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb",
+            "   $ sudo dpkg -i google-chrome-stable_current_amd64.deb",
+        ]
     else:  # Windows
-        console.print("   1. Visit https://www.google.com/chrome/")
-        console.print("   2. Download and install")
+        out += [
+            "   1. Visit https://www.google.com/chrome/",
+            "   2. Download and install",
+        ]
     
-    console.print("\n📦 Python Dependencies:")
-    console.print("   $ pip install selenium webdriver-manager python-dotenv rich")
+    out += [
+        "\n📦 Python Dependencies:",
+        "   $ pip install selenium webdriver-manager python-dotenv rich",
+        "\n🧪 Test Your Setup:",
+        "   $ python enhanced_web_automation.py --test",
+    ]
     
-    console.print("\n🧪 Test Your Setup:")
-    console.print("   $ python enhanced_web_automation.py --test")
+    console.print(Group(
+        Panel.fit("📖 Installation & Setup Guide", style="bold blue"),
+        "\n".join(out)
+    ))
 
 
 def main():
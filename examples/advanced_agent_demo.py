@@ -7,46 +7,151 @@ Powered by Claude Sonnet 4.5 (claude-sonnet-4-5-20250929) for superior performan
 
 import os
 import sys
+import asyncio
 import json
 import time
+import random
+import hashlib
+import threading
 from pathlib import Path
 
+import cv2
+
 # Add the src directory to Python path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from pc_agent import ComputerAgent
 
+# Example task for the AI planning demo
+DEMO_TASK = """
+        Take a screenshot of the current screen, analyze it for any text content,
+        and create a summary of what's visible on screen
+        """
+
+# On-disk cache of Claude task plans, keyed by task description hash
+PLAN_CACHE_PATH = Path.home() / ".cache" / "pc_agent" / "plans.json"
+
+
+def _plan_cache_key(task_description):
+    """Hash a task description into a plan cache key"""
+    return hashlib.sha256(task_description.strip().encode()).hexdigest()
+
+
+def load_cached_plan(task_description):
+    """Return a previously created plan for this task, or None"""
+    try:
+        with open(PLAN_CACHE_PATH, 'r') as f:
+            return json.load(f).get(_plan_cache_key(task_description))
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_plan(task_description, plan):
+    """Write a successfully created plan through to the cache"""
+    try:
+        with open(PLAN_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    cache[_plan_cache_key(task_description)] = plan
+    
+    try:
+        PLAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = PLAN_CACHE_PATH.with_suffix(".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(temp_path, PLAN_CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️  Could not cache task plan: {e}")
+
+
+# Set while no WebDriver warm-up is in flight
+_DRIVER_READY = threading.Event()
+_DRIVER_READY.set()
+
+
+def prewarm_web_automator(agent):
+    """Start the WebDriver on a background thread while other demos run"""
+    def _warm_up():
+        try:
+            agent.initialize_web_automator()
+        except Exception as e:
+            print(f"⚠️  Web automator warm-up failed: {e}")
+        finally:
+            _DRIVER_READY.set()
+    
+    _DRIVER_READY.clear()
+    threading.Thread(target=_warm_up, name="webdriver-warmup", daemon=True).start()
+
+
+def _driver_responsive(agent, timeout=1.0, interval=0.1):
+    """Poll the WebDriver until it answers a cheap command (or timeout)"""
+    if getattr(agent, 'web_automator', None) is None:
+        return True  # Torn down - a fresh driver is launched on the next attempt
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            agent.web_automator.driver.current_url
+            return True
+        except Exception:
+            time.sleep(interval)
+    return False
+
 
 def recover_navigation(agent, url, max_attempts=3):
     """Attempt navigation with automatic recovery from failures"""
+    # Reuse the pre-warmed driver rather than starting a second one
+    if not _DRIVER_READY.is_set():
+        print("⏳ Waiting for web automator warm-up...")
+        _DRIVER_READY.wait()
+    
+    consecutive_failures = 0
+    
     for attempt in range(max_attempts):
         try:
             # Ensure web automator exists
             if not hasattr(agent, 'web_automator') or agent.web_automator is None:
                 print(f"🔄 Initializing web automator (attempt {attempt + 1})...")
                 agent.initialize_web_automator()
-                time.sleep(2)
             
             # Try navigation
             if agent.navigate_to(url):
                 print("✅ Navigation successful!")
                 return True
             
-            # Failed - cleanup and retry
             print(f"⚠️  Navigation failed (attempt {attempt + 1}/{max_attempts})")
-            if attempt < max_attempts - 1:
-                print("🔄 Reinitializing web automator...")
-                try:
-                    agent.web_automator.cleanup()
-                except:
-                    pass
-                agent.web_automator = None
-                time.sleep(3)
-                
         except Exception as e:
             print(f"❌ Error on attempt {attempt + 1}: {e}")
-            if attempt < max_attempts - 1:
-                time.sleep(3)
+        
+        consecutive_failures += 1
+        if attempt == max_attempts - 1:
+            break
+        
+        if consecutive_failures < 2:
+            # Keep the browser session; just reset its state
+            print("🔄 Resetting browser session...")
+            try:
+                driver = agent.web_automator.driver
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception:
+                consecutive_failures = 2
+        
+        if consecutive_failures >= 2:
+            # Session looks broken - tear it down and relaunch
+            print("🔄 Reinitializing web automator...")
+            try:
+                agent.web_automator.cleanup()
+            except:
+                pass
+            agent.web_automator = None
+            consecutive_failures = 0
+        
+        # Retry as soon as the driver responds; otherwise back off with jitter
+        if not _driver_responsive(agent):
+            time.sleep(random.uniform(0.3, 0.8) * 2 ** attempt)
     
     print("❌ All navigation attempts failed")
     print("💡 See NAVIGATION_TROUBLESHOOTING.md for help")
@@ -81,10 +186,11 @@ def main():
             print(f"❌ Claude API connection failed: {test_result['message']}")
             return
         
+        # Start the browser in the background; it is needed later by the web demo
+        prewarm_web_automator(agent)
+        
         # Demonstrate advanced capabilities
-        demonstrate_screen_analysis(agent)
-        demonstrate_web_automation(agent)
-        demonstrate_ai_task_planning(agent)
+        asyncio.run(main_async(agent))
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -96,9 +202,30 @@ def main():
             pass
 
 
-def demonstrate_screen_analysis(agent):
-    """Demonstrate advanced screen analysis with Claude vision"""
-    print("\n📸 Screen Analysis with Claude Vision")
+async def main_async(agent):
+    """Run the demos, overlapping the ones that do not need user input"""
+    loop = asyncio.get_running_loop()
+    
+    # Screen analysis (local CV), web automation (browser I/O) and plan
+    # creation (Claude API) are independent and mostly blocking, so each
+    # runs in an executor thread. Screenshots for Claude are collected and
+    # analyzed together in one multi-image request afterwards.
+    screen_captures, web_captures = [], []
+    _, _, plan = await asyncio.gather(
+        loop.run_in_executor(None, demonstrate_screen_analysis, agent, screen_captures),
+        loop.run_in_executor(None, demonstrate_web_automation, agent, web_captures),
+        loop.run_in_executor(None, create_task_plan, agent, DEMO_TASK),
+    )
+    
+    demonstrate_batch_vision_analysis(agent, screen_captures + web_captures)
+    
+    # Interactive (input() prompt) - stays serialized
+    demonstrate_ai_task_planning(agent, plan)
+
+
+def demonstrate_screen_analysis(agent, captures):
+    """Demonstrate advanced screen analysis with computer vision"""
+    print("\n📸 Screen Analysis with Computer Vision")
     print("-" * 40)
     
     try:
@@ -108,7 +235,7 @@ def demonstrate_screen_analysis(agent):
         
         # Analyze with computer vision
         print("🔍 Analyzing with computer vision...")
-        cv_analysis = agent.analyze_screen()
+        cv_analysis = agent.vision_analyzer.analyze_image(screenshot)
         
         if cv_analysis:
             print(f"👁️  Found {cv_analysis.get('ui_elements_count', 0)} UI elements")
@@ -121,61 +248,31 @@ def demonstrate_screen_analysis(agent):
                 for i, color in enumerate(colors, 1):
                     print(f"   {i}. {color['hex']} ({color['percentage']:.1f}%)")
         
-        # Get Claude's interpretation
-        print("🧠 Getting Claude's analysis...")
-        # Convert screenshot to bytes for Claude
-        import cv2
-        from PIL import Image
-        import io
-        
-        # Convert numpy array to PIL Image
-        image_pil = Image.fromarray(cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB))
-        
-        # Convert to bytes
-        img_byte_arr = io.BytesIO()
-        image_pil.save(img_byte_arr, format='PNG')
-        img_bytes = img_byte_arr.getvalue()
-        
-        claude_analysis = agent.claude_client.analyze_screenshot(
-            img_bytes, 
+        # Queue the downscaled JPEG for the batched Claude analysis
+        captures.append((
+            agent.vision_analyzer.encode_for_claude(screenshot),
             "Analyze this screen for interactive elements and current state"
-        )
-        
-        if 'error' not in claude_analysis:
-            print("🎯 Claude's insights:")
-            if 'current_state' in claude_analysis:
-                print(f"   State: {claude_analysis['current_state']}")
-            
-            elements = claude_analysis.get('elements', [])
-            if elements:
-                print(f"   Interactive elements found: {len(elements)}")
-                for elem in elements[:3]:  # Show first 3
-                    print(f"   • {elem.get('type', 'unknown')}: {elem.get('text', 'N/A')}")
+        ))
         
     except Exception as e:
         print(f"❌ Screen analysis failed: {e}")
 
 
-def demonstrate_web_automation(agent):
+def demonstrate_web_automation(agent, captures):
     """Demonstrate intelligent web automation"""
     print("\n🌐 Intelligent Web Automation")
     print("-" * 40)
     
     try:
-        # Ensure web automator is initialized
-        if not hasattr(agent, 'web_automator') or agent.web_automator is None:
-            print("⚠️  Initializing web automator...")
-            agent.initialize_web_automator()
-        
-        # Navigate to a search engine
+        # Navigate to a search engine (uses the pre-warmed web automator)
         print("🔗 Opening web browser...")
         success = recover_navigation(agent, "https://www.google.com")
         
         if success:
             print("✅ Browser opened successfully")
             
-            # Wait a moment for page to load
-            time.sleep(2)
+            # Wait for the page to finish loading
+            agent.web_automator.wait_for_ready(timeout=5)
             
             # Perform a search using AI planning
             search_query = "artificial intelligence computer vision"
@@ -185,11 +282,20 @@ def demonstrate_web_automation(agent):
             if agent.web_search(search_query):
                 print("✅ Search completed")
                 
-                # Take a screenshot of results
-                time.sleep(2)
+                # Take a screenshot of results once they are rendered
+                agent.web_automator.wait_for_ready(timeout=5, selector="h3")
                 screenshot_path = "screenshots/search_results.png"
-                agent.web_automator.take_screenshot(screenshot_path)
-                print(f"📸 Screenshot saved: {screenshot_path}")
+                if agent.web_automator.take_screenshot(screenshot_path):
+                    print(f"📸 Screenshot saved: {screenshot_path}")
+                    # Same downscale + JPEG encode as the screen capture in this batch
+                    page = cv2.imread(screenshot_path)
+                    if page is not None:
+                        captures.append((
+                            agent.vision_analyzer.encode_for_claude(
+                                cv2.cvtColor(page, cv2.COLOR_BGR2RGB)
+                            ),
+                            f"Search results page for '{search_query}'"
+                        ))
                 
                 # Get page title
                 title = agent.web_automator.get_page_title()
@@ -210,23 +316,69 @@ def demonstrate_web_automation(agent):
         print("💡 Tip: Make sure Safari/Chrome is properly configured for automation")
 
 
-def demonstrate_ai_task_planning(agent):
+def demonstrate_batch_vision_analysis(agent, captures):
+    """Analyze all collected screenshots with a single Claude vision request"""
+    print("\n🧠 Claude Vision Analysis")
+    print("-" * 40)
+    
+    if not captures:
+        print("⚠️  No screenshots collected - skipping")
+        return
+    
+    try:
+        print(f"🧠 Sending {len(captures)} screenshot(s) to Claude in one request...")
+        batch = agent.claude_client.analyze_screenshots_batch(captures)
+        
+        if 'error' in batch:
+            print(f"❌ Claude analysis failed: {batch['error']}")
+            return
+        
+        for (_, context), analysis in zip(captures, batch.get('screenshots', [])):
+            print(f"🎯 Claude's insights ({context}):")
+            if 'current_state' in analysis:
+                print(f"   State: {analysis['current_state']}")
+            
+            elements = analysis.get('elements', [])
+            if elements:
+                print(f"   Interactive elements found: {len(elements)}")
+                for elem in elements[:3]:  # Show first 3
+                    print(f"   • {elem.get('type', 'unknown')}: {elem.get('text', 'N/A')}")
+        
+    except Exception as e:
+        print(f"❌ Claude vision analysis failed: {e}")
+
+
+def create_task_plan(agent, task_description):
+    """Create a task plan with Claude, reusing a cached plan for the same task"""
+    try:
+        plan = load_cached_plan(task_description)
+        if plan is not None:
+            print("💾 Using cached plan")
+            return plan
+        
+        plan = agent.claude_client.plan_task(task_description)
+        if 'error' not in plan:
+            store_cached_plan(task_description, plan)
+        return plan
+        
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def demonstrate_ai_task_planning(agent, plan=None):
     """Demonstrate AI-powered task planning and execution"""
     print("\n🧠 AI Task Planning with Claude")
     print("-" * 40)
     
     try:
-        # Example task
-        task_description = """
-        Take a screenshot of the current screen, analyze it for any text content,
-        and create a summary of what's visible on screen
-        """
+        task_description = DEMO_TASK
         
         print("📋 Task:", task_description.strip())
-        print("🤔 Creating execution plan with Claude...")
         
-        # Create task plan
-        plan = agent.claude_client.plan_task(task_description)
+        # Create task plan unless one was prepared in the background
+        if plan is None:
+            print("🤔 Creating execution plan with Claude...")
+            plan = create_task_plan(agent, task_description)
         
         if 'error' not in plan:
             print("✅ Task plan created!")
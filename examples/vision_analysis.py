@@ -7,7 +7,9 @@ Demonstrates advanced computer vision capabilities with Claude integration
 import os
 import sys
 import json
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the src directory to Python path
@@ -15,6 +17,21 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from pc_agent import ComputerAgent
 
+# Matches a complete "current_state" JSON string inside a partial response
+CURRENT_STATE_PATTERN = re.compile(r'"current_state"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Most recent screenshot, shared by the demos while the screen is unchanged
+_last_capture = {"time": 0.0, "image": None}
+
+
+def _cached_capture(agent, ttl=1.0):
+    """Return a screenshot, reusing one taken within the last ttl seconds"""
+    now = time.monotonic()
+    if _last_capture["image"] is None or now - _last_capture["time"] > ttl:
+        _last_capture["image"] = agent.capture_screen()
+        _last_capture["time"] = now
+    return _last_capture["image"]
+
 
 def main():
     """Computer vision analysis examples"""
@@ -38,10 +55,11 @@ def main():
             print(f"⚠️  Claude API not available: {test_result['message']}")
             print("Some features will be limited...")
         
-        # Vision analysis examples
-        demo_screen_analysis(agent)
-        demo_element_detection(agent)
-        demo_claude_vision_analysis(agent)
+        # Vision analysis examples (one capture shared by all three)
+        screenshot = _cached_capture(agent)
+        demo_screen_analysis(agent, screenshot)
+        demo_element_detection(agent, screenshot)
+        demo_claude_vision_analysis(agent, screenshot)
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -52,7 +70,7 @@ def main():
             pass
 
 
-def demo_screen_analysis(agent):
+def demo_screen_analysis(agent, screenshot=None):
     """Demonstrate basic screen analysis"""
     print("\n📸 Basic Screen Analysis")
     print("-" * 30)
@@ -61,11 +79,12 @@ def demo_screen_analysis(agent):
         print("📷 Capturing and analyzing screen...")
         
         # Capture screenshot
-        screenshot = agent.capture_screen()
+        if screenshot is None:
+            screenshot = _cached_capture(agent)
         print(f"✅ Screenshot captured: {screenshot.shape}")
         
         # Analyze with computer vision
-        analysis = agent.analyze_screen()
+        analysis = agent.analyze_screen(image=screenshot)
         
         if analysis and 'error' not in analysis:
             print("\n📊 Analysis Results:")
@@ -103,7 +122,7 @@ def demo_screen_analysis(agent):
         print(f"❌ Screen analysis failed: {e}")
 
 
-def demo_element_detection(agent):
+def demo_element_detection(agent, screenshot=None):
     """Demonstrate element detection capabilities"""
     print("\n🔍 Element Detection Demo")
     print("-" * 30)
@@ -112,7 +131,8 @@ def demo_element_detection(agent):
         print("🔎 Analyzing screen for interactive elements...")
         
         # Get current screen
-        screenshot = agent.capture_screen()
+        if screenshot is None:
+            screenshot = _cached_capture(agent)
         
         # Analyze with vision analyzer
         analysis = agent.vision_analyzer.analyze_image(screenshot)
@@ -151,7 +171,7 @@ def demo_element_detection(agent):
         print(f"❌ Element detection failed: {e}")
 
 
-def demo_claude_vision_analysis(agent):
+def demo_claude_vision_analysis(agent, screenshot=None):
     """Demonstrate Claude's vision analysis capabilities"""
     print("\n🧠 Claude Vision Analysis")
     print("-" * 30)
@@ -164,35 +184,49 @@ def demo_claude_vision_analysis(agent):
         print("📷 Getting Claude's interpretation of current screen...")
         
         # Capture screenshot
-        screenshot = agent.capture_screen()
-        
-        # Convert to bytes for Claude
-        import cv2
-        from PIL import Image
-        import io
-        
-        # Convert numpy array to PIL Image
-        image_pil = Image.fromarray(cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB))
+        if screenshot is None:
+            screenshot = _cached_capture(agent)
         
-        # Convert to bytes
-        img_byte_arr = io.BytesIO()
-        image_pil.save(img_byte_arr, format='PNG')
-        img_bytes = img_byte_arr.getvalue()
+        # Encode for Claude in the background while waiting for the task context
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            encode_future = executor.submit(agent.vision_analyzer.encode_for_claude, screenshot)
+            
+            # Get Claude's analysis
+            task_context = input("\nEnter task context (or press Enter for general analysis): ").strip()
+            img_bytes = encode_future.result()
         
-        # Get Claude's analysis
-        task_context = input("\nEnter task context (or press Enter for general analysis): ").strip()
         if not task_context:
             task_context = "Analyze this screen for interactive elements and current application state"
         
         print("🤔 Claude is analyzing the screen...")
-        analysis = agent.claude_client.analyze_screenshot(img_bytes, task_context)
+        
+        # Stream the response so the current state shows up as soon as it is generated
+        response_text = ""
+        state_shown = False
+        for chunk in agent.claude_client.analyze_screenshot_stream(img_bytes, task_context):
+            response_text += chunk
+            if not state_shown:
+                match = CURRENT_STATE_PATTERN.search(response_text)
+                if match:
+                    print("\n🎯 Claude's Analysis:")
+                    print(f"📊 Current State: {json.loads(match.group(1))}")
+                    state_shown = True
+        
+        try:
+            analysis = json.loads(response_text)
+        except json.JSONDecodeError:
+            analysis = {
+                "raw_response": response_text,
+                "error": "Could not parse JSON response"
+            }
         
         if analysis and 'error' not in analysis:
-            print("\n🎯 Claude's Analysis:")
-            
-            # Show current state
-            if 'current_state' in analysis:
-                print(f"📊 Current State: {analysis['current_state']}")
+            if not state_shown:
+                print("\n🎯 Claude's Analysis:")
+                
+                # Show current state
+                if 'current_state' in analysis:
+                    print(f"📊 Current State: {analysis['current_state']}")
             
             # Show elements found
             elements = analysis.get('elements', [])
@@ -7,6 +7,7 @@ Demonstrates web browsing and form interaction
 import os
 import sys
 import time
+import threading
 from pathlib import Path
 
 # Add the src directory to Python path
@@ -44,6 +45,15 @@ def main():
             pass
 
 
+def prefetch_next(agent, url=None, link_selector=None):
+    """Preconnect to the likely next page on a daemon thread (hidden behind input())"""
+    threading.Thread(
+        target=agent.web_automator.preconnect,
+        args=(url, link_selector),
+        daemon=True
+    ).start()
+
+
 def demo_google_search(agent):
     """Demonstrate Google search automation"""
     print("\n🔍 Google Search Demo")
@@ -64,12 +74,12 @@ def demo_google_search(agent):
             return
         
         print("✅ Google opened successfully")
-        time.sleep(2)  # Wait for page to load
+        agent.web_automator.wait_for_ready(timeout=5)  # Wait for page to load
         
         # Perform search
         if agent.web_search(query, "google"):
             print("✅ Search completed!")
-            time.sleep(2)
+            agent.web_automator.wait_for_ready(timeout=5, selector="h3")
             
             # Take a screenshot
             screenshot_path = f"screenshots/google_search_{int(time.time())}.png"
@@ -80,13 +90,16 @@ def demo_google_search(agent):
             title = agent.web_automator.get_page_title()
             print(f"📄 Page title: {title}")
             
+            # Warm up the first result's host while the user decides
+            prefetch_next(agent, link_selector="h3")
+            
             # Click on first result
             user_input = input("\n🖱️  Click on first search result? (y/n): ")
             if user_input.lower() == 'y':
                 # Try to click first result
-                if agent.web_automator.click_element("h3"):
+                if agent.web_automator.click_via_js("h3"):
                     print("✅ Clicked on first result")
-                    time.sleep(3)
+                    agent.web_automator.wait_for_ready(timeout=5)
                     
                     new_title = agent.web_automator.get_page_title()
                     print(f"📄 New page title: {new_title}")
@@ -117,7 +130,7 @@ def demo_form_interaction(agent):
             return
         
         print("✅ Form page opened")
-        time.sleep(2)
+        agent.web_automator.wait_for_ready(timeout=5, selector="form")
         
         # Fill form fields
         form_data = {
@@ -132,12 +145,15 @@ def demo_form_interaction(agent):
         if success:
             print("✅ Form filled successfully!")
             
+            # Warm up the form's submit target while the user decides
+            prefetch_next(agent, link_selector="form")
+            
             # Ask user if they want to submit
             user_input = input("🚀 Submit the form? (y/n): ")
             if user_input.lower() == 'y':
                 if agent.web_automator.submit_form():
                     print("✅ Form submitted!")
-                    time.sleep(2)
+                    agent.web_automator.wait_for_ready(timeout=5)
                     
                     # Take screenshot of result
                     screenshot_path = f"screenshots/form_result_{int(time.time())}.png"
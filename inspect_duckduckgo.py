@@ -4,7 +4,13 @@ DuckDuckGo Element Inspector
 Investigate the actual HTML structure to find correct selectors
 """
 
+import os
 import time
+import shutil
+import socket
+import asyncio
+import subprocess
+from typing import List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,92 +20,222 @@ from rich.table import Table
 
 console = Console()
 
-def inspect_duckduckgo():
-    """Inspect DuckDuckGo page to find actual element selectors"""
+DEBUG_HOST = "127.0.0.1"
+DEBUG_PORT = 9222
+DEBUG_PROFILE_DIR = os.path.expanduser("~/.cache/pc_agent/inspector-chrome")
+
+CHROME_CANDIDATES = [
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+]
+
+SELECTORS_TO_TEST = [
+    "input[name='q']",
+    "input#search_form_input", 
+    "input[type='text']",
+    "input[type='search']",
+    "[data-testid*='search']",
+    "[aria-label*='search']",
+    "[placeholder*='search']",
+    ".search-wrap input",
+    "#searchbox_input",
+    "input.searchbox_input"
+]
+
+def build_inputs_table(inputs, title: str = "Input Elements Found") -> Table:
+    """
+    Build the input-elements table from [type, name, id, class, placeholder] rows
+    """
+    table = Table(title=title)
+    table.add_column("Index", style="cyan")
+    table.add_column("Type", style="magenta")
+    table.add_column("Name", style="green")
+    table.add_column("ID", style="yellow")
+    table.add_column("Class", style="blue")
+    table.add_column("Placeholder", style="white")
+    
+    for i, attributes in enumerate(inputs):
+        input_type, name, elem_id, class_name, placeholder = (
+            value or "None" for value in attributes
+        )
+        
+        table.add_row(
+            str(i), input_type, name, elem_id, 
+            class_name[:30] + "..." if len(class_name) > 30 else class_name,
+            placeholder[:30] + "..." if len(placeholder) > 30 else placeholder
+        )
+    
+    return table
+
+def _debug_port_open() -> bool:
+    """Check whether a Chrome is already listening on the remote-debugging port"""
+    try:
+        with socket.create_connection((DEBUG_HOST, DEBUG_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def _find_chrome_binary() -> Optional[str]:
+    """Locate a Chrome/Chromium executable to launch for --attach"""
+    for candidate in CHROME_CANDIDATES:
+        if os.path.isabs(candidate):
+            if os.path.exists(candidate):
+                return candidate
+        else:
+            path = shutil.which(candidate)
+            if path:
+                return path
+    return None
+
+def ensure_debug_chrome(headless: bool = True, timeout: float = 10.0) -> bool:
+    """
+    Make sure a persistent Chrome with --remote-debugging-port is running
+    
+    The first call launches it (detached, with its own profile directory);
+    later calls find it already listening and return immediately.
+    """
+    if _debug_port_open():
+        return True
+    
+    chrome = _find_chrome_binary()
+    if not chrome:
+        console.print("❌ Chrome not found; cannot start a shared debugging browser")
+        return False
+    
+    os.makedirs(DEBUG_PROFILE_DIR, exist_ok=True)
+    args = [
+        chrome,
+        f"--remote-debugging-port={DEBUG_PORT}",
+        f"--user-data-dir={DEBUG_PROFILE_DIR}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if headless:
+        args.append("--headless=new")
+    subprocess.Popen(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    console.print(f"🚀 Started shared Chrome on {DEBUG_HOST}:{DEBUG_PORT}")
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _debug_port_open():
+            return True
+        time.sleep(0.1)
+    return False
+
+def create_driver(browser: str = "chrome", headless: bool = True, attach: bool = False):
+    """
+    Create the WebDriver used for inspection
+    
+    Args:
+        browser: "chrome" (default) or "safari"
+        headless: Run Chrome without a window (ignored for Safari, which has no headless mode)
+        attach: Drive a long-lived Chrome on the remote-debugging port instead of
+            launching a new browser (Chrome only)
+    """
+    if browser == "safari":
+        return webdriver.Safari()
+    
+    opts = webdriver.ChromeOptions()
+    if attach:
+        if not ensure_debug_chrome(headless=headless):
+            raise RuntimeError(f"No Chrome listening on {DEBUG_HOST}:{DEBUG_PORT}")
+        opts.add_experimental_option("debuggerAddress", f"{DEBUG_HOST}:{DEBUG_PORT}")
+        return webdriver.Chrome(options=opts)
+    
+    if headless:
+        opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    return webdriver.Chrome(options=opts)
+
+def inspect_duckduckgo(interactive: bool = False, browser: str = "chrome", attach: bool = False):
+    """
+    Inspect DuckDuckGo page to find actual element selectors
+    
+    Args:
+        interactive: Keep the browser open for visual inspection at the end
+            (also shows the Chrome window instead of running headless)
+        browser: WebDriver to use, "chrome" or "safari"
+        attach: Reuse the shared remote-debugging Chrome and leave it running
+    """
     
     console.print("🦆 Inspecting DuckDuckGo HTML Structure", style="bold cyan")
     
+    driver = None
     try:
-        # Initialize Safari WebDriver
-        driver = webdriver.Safari()
-        console.print("✅ Safari WebDriver initialized")
+        driver = create_driver(browser, headless=not interactive, attach=attach)
+        console.print(f"✅ {browser.title()} WebDriver initialized")
         
         # Navigate to DuckDuckGo
         driver.get("https://duckduckgo.com")
         console.print("✅ Navigated to DuckDuckGo")
         
-        # Wait for page to load
-        time.sleep(3)
+        # Wait for the search box instead of a fixed delay
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='q'], #searchbox_input"))
+        )
         
         # Get page title
         console.print(f"📄 Page title: {driver.title}")
         
         # Look for all input elements
         console.print("\n🔍 Finding all input elements...")
-        inputs = driver.find_elements(By.TAG_NAME, "input")
+        # One script returns every input's attributes (one round trip instead of
+        # five get_attribute calls per element)
+        inputs = driver.execute_script(
+            "return Array.from(document.querySelectorAll('input')).map(e => "
+            "[e.getAttribute('type'), e.getAttribute('name'), e.getAttribute('id'), "
+            "e.getAttribute('class'), e.getAttribute('placeholder')]);"
+        )
         
         if inputs:
-            table = Table(title="Input Elements Found")
-            table.add_column("Index", style="cyan")
-            table.add_column("Type", style="magenta")
-            table.add_column("Name", style="green")
-            table.add_column("ID", style="yellow")
-            table.add_column("Class", style="blue")
-            table.add_column("Placeholder", style="white")
-            
-            for i, input_elem in enumerate(inputs):
-                input_type = input_elem.get_attribute("type") or "None"
-                name = input_elem.get_attribute("name") or "None"
-                elem_id = input_elem.get_attribute("id") or "None"
-                class_name = input_elem.get_attribute("class") or "None"
-                placeholder = input_elem.get_attribute("placeholder") or "None"
-                
-                table.add_row(
-                    str(i), input_type, name, elem_id, 
-                    class_name[:30] + "..." if len(class_name) > 30 else class_name,
-                    placeholder[:30] + "..." if len(placeholder) > 30 else placeholder
-                )
-            
-            console.print(table)
+            console.print(build_inputs_table(inputs))
         else:
             console.print("❌ No input elements found")
         
         # Look for search-related elements by various methods
         console.print("\n🎯 Trying specific search selectors...")
         
-        selectors_to_test = [
-            "input[name='q']",
-            "input#search_form_input", 
-            "input[type='text']",
-            "input[type='search']",
-            "[data-testid*='search']",
-            "[aria-label*='search']",
-            "[placeholder*='search']",
-            ".search-wrap input",
-            "#searchbox_input",
-            "input.searchbox_input"
-        ]
-        
-        for selector in selectors_to_test:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
+        # Probe every selector in one script: per selector, either
+        # [[tagName, visible], ...] or an error string for invalid CSS
+        results = driver.execute_script(
+            "return arguments[0].map(s => { try { "
+            "return Array.from(document.querySelectorAll(s)).map(e => "
+            "[e.tagName.toLowerCase(), e.offsetParent !== null || "
+            "e.getClientRects().length > 0]); "
+            "} catch (err) { return String(err); } });",
+            SELECTORS_TO_TEST
+        )
+        
+        # Buffer the probe report and write it to the terminal once
+        with console:
+            for selector, elements in zip(SELECTORS_TO_TEST, results):
+                if isinstance(elements, str):
+                    console.print(f"⚠️  Error with selector {selector}: {elements}")
+                elif elements:
                     console.print(f"✅ Found {len(elements)} element(s) with: {selector}")
-                    for i, elem in enumerate(elements):
-                        console.print(f"   Element {i}: {elem.tag_name} - visible: {elem.is_displayed()}")
+                    for i, (tag_name, visible) in enumerate(elements):
+                        console.print(f"   Element {i}: {tag_name} - visible: {visible}")
                 else:
                     console.print(f"❌ No elements found with: {selector}")
-            except Exception as e:
-                console.print(f"⚠️  Error with selector {selector}: {e}")
         
         # Get page source snippet around potential search areas
         console.print("\n📝 Page source analysis...")
-        page_source = driver.page_source
+        page_source = driver.page_source.lower()
         
-        # Look for search-related patterns in HTML
+        # Look for search-related patterns in HTML (lowercased once above)
         search_patterns = ['search', 'input', 'form', 'query']
         for pattern in search_patterns:
-            if pattern in page_source.lower():
+            if pattern in page_source:
                 console.print(f"✅ Found '{pattern}' in page source")
             else:
                 console.print(f"❌ '{pattern}' not found in page source")
@@ -109,18 +245,114 @@ def inspect_duckduckgo():
         console.print("📸 Screenshot saved: screenshots/duckduckgo_inspection.png")
         
         # Wait a bit to see the page
-        console.print("\n⏸️  Keeping browser open for 10 seconds for visual inspection...")
-        time.sleep(10)
+        if interactive:
+            console.print("\n⏸️  Keeping browser open for 10 seconds for visual inspection...")
+            time.sleep(10)
         
     except Exception as e:
         console.print(f"❌ Error during inspection: {e}")
     
     finally:
+        if driver is not None:
+            try:
+                if attach:
+                    # Only stop chromedriver; the shared browser stays up for the next run
+                    driver.service.stop()
+                    console.print("🔌 Detached from shared browser")
+                else:
+                    driver.quit()
+                    console.print("🧹 Browser closed")
+            except:
+                pass
+
+async def inspect_page(context, url: str) -> None:
+    """
+    Inspect one page in its own tab of a shared Playwright browser context
+    
+    Args:
+        context: playwright.async_api BrowserContext
+        url: Page to inspect
+    """
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="domcontentloaded")
+        title = await page.title()
+        
+        # Batch attribute extraction - one evaluate for every input on the page
+        inputs = await page.locator("input").evaluate_all(
+            "els => els.map(e => [e.getAttribute('type'), e.getAttribute('name'), "
+            "e.getAttribute('id'), e.getAttribute('class'), e.getAttribute('placeholder')])"
+        )
+        counts = await page.evaluate(
+            "sels => sels.map(s => document.querySelectorAll(s).length)",
+            SELECTORS_TO_TEST
+        )
+        
+        # Print each site's report in one go so concurrent tabs don't interleave
+        console.print(f"\n📄 {url} - {title}", style="bold cyan")
+        if inputs:
+            console.print(build_inputs_table(inputs, title=f"Input Elements on {url}"))
+        else:
+            console.print("❌ No input elements found")
+        console.print("\n".join(
+            f"✅ Found {count} element(s) with: {selector}" if count
+            else f"❌ No elements found with: {selector}"
+            for selector, count in zip(SELECTORS_TO_TEST, counts)
+        ))
+    except Exception as e:
+        console.print(f"❌ Error inspecting {url}: {e}")
+    finally:
+        await page.close()
+
+async def inspect_sites(urls: List[str]) -> None:
+    """
+    Inspect several pages concurrently with Playwright's async API
+    
+    All pages share one headless Chromium and one context; while one tab
+    waits on navigation the others keep making progress.
+    
+    Args:
+        urls: Pages to inspect
+    """
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
         try:
-            driver.quit()
-            console.print("🧹 Browser closed")
-        except:
-            pass
+            context = await browser.new_context()
+            await asyncio.gather(*(inspect_page(context, url) for url in urls))
+        finally:
+            await browser.close()
 
 if __name__ == "__main__":
-    inspect_duckduckgo()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Inspect DuckDuckGo element selectors")
+    parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Keep the browser open for 10 seconds for visual inspection'
+    )
+    parser.add_argument(
+        '--browser',
+        choices=['chrome', 'safari'],
+        default='chrome',
+        help='WebDriver to inspect with (chrome runs headless unless --interactive)'
+    )
+    parser.add_argument(
+        '--attach',
+        action='store_true',
+        help=f'Reuse a persistent Chrome on port {DEBUG_PORT}, starting it on first use'
+    )
+    parser.add_argument(
+        '--sites',
+        nargs='+',
+        metavar='URL',
+        help='Inspect these pages concurrently with Playwright instead of the Selenium run'
+    )
+    args = parser.parse_args()
+    
+    if args.sites:
+        asyncio.run(inspect_sites(args.sites))
+    else:
+        inspect_duckduckgo(interactive=args.interactive, browser=args.browser, attach=args.attach)
\ No newline at end of file
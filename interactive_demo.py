@@ -7,7 +7,6 @@ AUTO-DETECTION: Script automatically detects project directory location.
 No manual path configuration required!
 """
 
-import subprocess
 import sys
 import time
 import os
@@ -78,10 +77,11 @@ def main():
             project_path = Path(__file__).parent.absolute()
             print(f"📂 Using project path: {project_path}")
             
-            subprocess.run([
-                sys.executable, 
-                "manual_interactive_automation.py"
-            ], cwd=str(project_path))
+            # Replace this process with the shell; nothing runs after it exits,
+            # so there is no need to keep a second interpreter alive
+            sys.stdout.flush()
+            os.chdir(project_path)
+            os.execv(sys.executable, [sys.executable, "manual_interactive_automation.py"])
         else:
             print("👋 Demo completed. Run the command above when ready!")
     except KeyboardInterrupt:
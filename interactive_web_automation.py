@@ -13,46 +13,94 @@ Usage:
 import os
 import sys
 import json
-import time
-import asyncio
-import threading
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from contextlib import contextmanager
+import importlib.util
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from urllib.parse import urlparse
 
-from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt
 from rich.table import Table
-from rich.live import Live
-from rich.layout import Layout
 from rich.text import Text
 
-# Import our automation components
-from live_web_automation_enhanced import SafeWebAutomator, AutomationSession
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-# Load environment
-load_dotenv()
+# prompt_toolkit (optional) - line editing, history and tab-completion for the command loop.
+# Only probed here; imported when the command loop first reads input.
+PROMPT_TOOLKIT_AVAILABLE = importlib.util.find_spec("prompt_toolkit") is not None
+
+# The automation stack (selenium, webdriver-manager, the Claude client) is imported
+# inside the service so `--help` and argument errors return without loading it.
 
 console = Console()
 
+_COMMANDS = [
+    ("navigate <url>", "Navigate to a website", "navigate https://example.com"),
+    ("search <query>", "Search on DuckDuckGo", "search Python automation"),
+    ("find <selector>", "Find element on page", "find input[name='q']"),
+    ("click <selector>", "Click an element", "click button.submit"),
+    ("type <selector> <text>", "Type text in element", "type input#email hello@example.com"),
+    ("screenshot", "Take a screenshot", "screenshot"),
+    ("analyze", "Analyze current page", "analyze"),
+    ("demo", "Run demo examples", "demo"),
+    ("status", "Show service status", "status"),
+    ("help", "Show this help", "help"),
+    ("quit", "Exit the service", "quit")
+]
+
 
 class InteractiveWebAutomationService:
     """Persistent web automation service that remains available for user commands"""
     
+    ELEMENT_CACHE_SIZE = 64
+    HISTORY_PATH = os.path.expanduser("~/.cache/pc_agent/webauto_history")
+    COMMAND_WORDS = [usage.split()[0] for usage, _, _ in _COMMANDS]
+    
     def __init__(self, config: Dict[str, Any]):
+        from live_web_automation_enhanced import AutomationSession
+        
         self.config = config
         self.automator = None
         self.session = AutomationSession()
         self.running = True
         self.status = "Initialized"
         self.last_action = None
+        self._page_url = None
+        self._element_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._resolved_selectors: Dict[str, str] = {}
+        self._prompt_session = None
+        self._status_panel = None
+        self._help_table = None
+        self._status_key = None
+        
+        # Command name -> handler taking the argument list
+        self._cmd_table = {
+            "navigate": self.cmd_navigate,
+            "search": self.cmd_search,
+            "find": self.cmd_find,
+            "click": self.cmd_click,
+            "type": self.cmd_type,
+            "screenshot": lambda args: self.cmd_screenshot(),
+            "analyze": lambda args: self.cmd_analyze(),
+            "demo": lambda args: self.cmd_demo(),
+            "status": lambda args: self.cmd_status(),
+            "help": lambda args: self.cmd_help(),
+            "quit": lambda args: self.cmd_quit(),
+            "exit": lambda args: self.cmd_quit(),
+            "stop": lambda args: self.cmd_quit(),
+        }
         
     def initialize(self):
         """Initialize the automation service"""
         try:
             console.print("🚀 Initializing Interactive Web Automation Service...", style="bold blue")
+            from live_web_automation_enhanced import SafeWebAutomator
+            
             self.automator = SafeWebAutomator(self.config, self.session)
             
             # Initialize the automator
@@ -67,8 +115,60 @@ class InteractiveWebAutomationService:
             self.status = f"Error: {e}"
             return False
     
+    def _read_command(self) -> str:
+        """Read one command line, via prompt_toolkit when it is installed"""
+        if not PROMPT_TOOLKIT_AVAILABLE:
+            return Prompt.ask("[bold cyan]web-automation[/bold cyan]", default="help")
+        
+        if self._prompt_session is None:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.completion import WordCompleter
+            from prompt_toolkit.history import FileHistory
+            
+            os.makedirs(os.path.dirname(self.HISTORY_PATH), exist_ok=True)
+            self._prompt_session = PromptSession(
+                history=FileHistory(self.HISTORY_PATH),
+                completer=WordCompleter(self.COMMAND_WORDS)
+            )
+        return self._prompt_session.prompt("web-automation> ") or "help"
+    
+    def _cached_find(self, selector: str) -> Optional[Any]:
+        """Find an element, reusing the last match for this page when it is still attached"""
+        key = (self._page_url or "", selector)
+        element = self._element_cache.get(key)
+        if element is not None:
+            try:
+                # Cheap liveness probe; raises once the DOM node has been replaced
+                element.is_enabled()
+                self._element_cache.move_to_end(key)
+                return element
+            except Exception:
+                del self._element_cache[key]
+        
+        element = self.automator.find_element(selector)
+        if element is not None:
+            self._element_cache[key] = element
+            if len(self._element_cache) > self.ELEMENT_CACHE_SIZE:
+                self._element_cache.popitem(last=False)
+        return element
+    
+    def _invalidate_elements(self, url: Optional[str] = None):
+        """Drop cached elements after the page changes"""
+        self._element_cache.clear()
+        self._page_url = url
+    
     def get_status_display(self) -> Panel:
-        """Get current status display"""
+        """Get current status display (rebuilt only when status or session metrics change)"""
+        # The session logs are append-only, so their lengths identify the metrics shown
+        key = (
+            self.status,
+            self.last_action,
+            len(self.session.actions_performed) if self.session else None,
+            len(self.session.errors_encountered) if self.session else None,
+        )
+        if self._status_panel is not None and key == self._status_key:
+            return self._status_panel
+        
         status_text = Text()
         
         # Service status
@@ -94,37 +194,28 @@ class InteractiveWebAutomationService:
         if self.last_action:
             status_text.append(f"\n🕐 Last Action: {self.last_action}")
         
-        return Panel(
+        self._status_panel = Panel(
             status_text,
             title="🌐 Interactive Web Automation Service",
             border_style="blue"
         )
+        self._status_key = key
+        return self._status_panel
     
     def show_available_commands(self):
         """Display available commands"""
-        table = Table(title="📋 Available Commands")
-        table.add_column("Command", style="cyan")
-        table.add_column("Description", style="white")
-        table.add_column("Example", style="dim")
-        
-        commands = [
-            ("navigate <url>", "Navigate to a website", "navigate https://example.com"),
-            ("search <query>", "Search on DuckDuckGo", "search Python automation"),
-            ("find <selector>", "Find element on page", "find input[name='q']"),
-            ("click <selector>", "Click an element", "click button.submit"),
-            ("type <selector> <text>", "Type text in element", "type input#email hello@example.com"),
-            ("screenshot", "Take a screenshot", "screenshot"),
-            ("analyze", "Analyze current page", "analyze"),
-            ("demo", "Run demo examples", "demo"),
-            ("status", "Show service status", "status"),
-            ("help", "Show this help", "help"),
-            ("quit", "Exit the service", "quit")
-        ]
-        
-        for cmd, desc, example in commands:
-            table.add_row(cmd, desc, example)
+        if self._help_table is None:
+            table = Table(title="📋 Available Commands")
+            table.add_column("Command", style="cyan")
+            table.add_column("Description", style="white")
+            table.add_column("Example", style="dim")
+            
+            for cmd, desc, example in _COMMANDS:
+                table.add_row(cmd, desc, example)
+            
+            self._help_table = table
         
-        console.print(table)
+        console.print(self._help_table)
     
     def execute_command(self, command: str) -> bool:
         """Execute user command"""
@@ -137,33 +228,13 @@ class InteractiveWebAutomationService:
         
         self.last_action = f"{cmd} {' '.join(args)}"
         
+        handler = self._cmd_table.get(cmd)
+        if handler is None:
+            console.print(f"❌ Unknown command: {cmd}. Type 'help' for available commands.", style="red")
+            return True
+        
         try:
-            if cmd == "navigate":
-                return self.cmd_navigate(args)
-            elif cmd == "search":
-                return self.cmd_search(args)
-            elif cmd == "find":
-                return self.cmd_find(args)
-            elif cmd == "click":
-                return self.cmd_click(args)
-            elif cmd == "type":
-                return self.cmd_type(args)
-            elif cmd == "screenshot":
-                return self.cmd_screenshot()
-            elif cmd == "analyze":
-                return self.cmd_analyze()
-            elif cmd == "demo":
-                return self.cmd_demo()
-            elif cmd == "status":
-                return self.cmd_status()
-            elif cmd == "help":
-                self.show_available_commands()
-                return True
-            elif cmd in ["quit", "exit", "stop"]:
-                return self.cmd_quit()
-            else:
-                console.print(f"❌ Unknown command: {cmd}. Type 'help' for available commands.", style="red")
-                return True
+            return handler(args)
         except Exception as e:
             console.print(f"❌ Command failed: {e}", style="red")
             return True
@@ -177,7 +248,11 @@ class InteractiveWebAutomationService:
         url = args[0]
         console.print(f"🌐 Navigating to {url}...")
         
-        if self.automator.navigate_to(url):
+        navigated = self.automator.navigate_to(url)
+        self._invalidate_elements(url if navigated else None)
+        if navigated:
+            # Settle before the next command so its first lookup doesn't poll
+            self.automator.wait_for_ready(timeout=5, network_idle=True)
             console.print(f"✅ Successfully navigated to {url}", style="green")
         else:
             console.print(f"❌ Failed to navigate to {url}", style="red")
@@ -194,21 +269,38 @@ class InteractiveWebAutomationService:
         console.print(f"🔍 Searching for: {query}")
         
         # Navigate to DuckDuckGo
-        if not self.automator.navigate_to("https://duckduckgo.com"):
+        navigated = self.automator.navigate_to("https://duckduckgo.com")
+        self._invalidate_elements("https://duckduckgo.com" if navigated else None)
+        if not navigated:
             console.print("❌ Failed to reach DuckDuckGo", style="red")
             return True
         
-        # Find and use search box
+        # Find and use search box, trying the selector that won last time first
         search_selectors = ["input[name='q']", "input#searchbox_input", "input[type='text']"]
-        search_element = self.automator.wait_for_element_advanced(search_selectors, timeout=10)
+        host = urlparse(self._page_url).netloc
+        search_selector = self._resolved_selectors.get(host)
+        search_element = self._cached_find(search_selector) if search_selector else None
+        
+        if search_element is None:
+            # Same per-selector budget wait_for_element_advanced uses for the whole list
+            timeout_per_selector = max(2, 10 // len(search_selectors))
+            for candidate in search_selectors:
+                search_element = self.automator.wait_for_element_advanced(
+                    [candidate], timeout=timeout_per_selector
+                )
+                if search_element:
+                    search_selector = candidate
+                    self._resolved_selectors[host] = candidate
+                    break
         
         if not search_element:
+            self._resolved_selectors.pop(host, None)
             console.print("❌ Search box not found", style="red")
             return True
         
-        # Type and submit search
-        if self.automator.type_text(search_selectors[0], query):
-            if self.automator.press_key(search_selectors[0], "ENTER"):
+        # Type into the element we already located, then submit
+        if self._type_into(search_element, search_selector, query):
+            if self.automator.press_key(search_selector, "ENTER"):
                 console.print(f"✅ Search completed for: {query}", style="green")
             else:
                 console.print("❌ Failed to submit search", style="red")
@@ -226,7 +318,7 @@ class InteractiveWebAutomationService:
         selector = " ".join(args)
         console.print(f"🔍 Looking for element: {selector}")
         
-        element = self.automator.find_element(selector)
+        element = self._cached_find(selector)
         if element:
             console.print(f"✅ Element found: {selector}", style="green")
         else:
@@ -243,7 +335,20 @@ class InteractiveWebAutomationService:
         selector = " ".join(args)
         console.print(f"👆 Clicking element: {selector}")
         
-        if self.automator.click_element(selector):
+        clicked = False
+        element = self._cached_find(selector)
+        if element is not None:
+            try:
+                element.click()
+                self.session.log_action("click", True, f"Clicked: {selector}")
+                clicked = True
+            except Exception:
+                # Not interactable yet or gone stale; let the wrapper wait for it
+                self._element_cache.pop((self._page_url or "", selector), None)
+        if not clicked:
+            clicked = self.automator.click_element(selector)
+        
+        if clicked:
             console.print(f"✅ Clicked: {selector}", style="green")
         else:
             console.print(f"❌ Failed to click: {selector}", style="red")
@@ -260,18 +365,31 @@ class InteractiveWebAutomationService:
         text = " ".join(args[1:])
         console.print(f"⌨️ Typing '{text}' in: {selector}")
         
-        if self.automator.type_text(selector, text):
+        if self._type_into(self._cached_find(selector), selector, text):
             console.print(f"✅ Text entered in: {selector}", style="green")
         else:
             console.print(f"❌ Failed to type in: {selector}", style="red")
         
         return True
     
+    def _type_into(self, element: Optional[Any], selector: str, text: str) -> bool:
+        """Type into an already-resolved element, falling back to a fresh lookup"""
+        if element is not None:
+            try:
+                element.clear()
+                element.send_keys(text)
+                self.session.log_action("type_text", True, f"Typed in {selector}")
+                return True
+            except Exception:
+                self._element_cache.pop((self._page_url or "", selector), None)
+        return self.automator.type_text(selector, text)
+    
     def cmd_screenshot(self) -> bool:
         """Take a screenshot"""
         console.print("📸 Taking screenshot...")
         
-        screenshot_path = self.automator.take_screenshot("user_requested")
+        # Diagnostic capture: JPEG is far cheaper to encode and store than PNG
+        screenshot_path = self.automator.take_screenshot("user_requested", image_format="jpg")
         if screenshot_path:
             console.print(f"✅ Screenshot saved: {screenshot_path}", style="green")
         else:
@@ -281,39 +399,41 @@ class InteractiveWebAutomationService:
     
     def cmd_analyze(self) -> bool:
         """Analyze current page"""
-        console.print("🔍 Analyzing current page...")
-        
-        # Get page info
-        if hasattr(self.automator, 'automator') and self.automator.automator and self.automator.automator.driver:
-            driver = self.automator.automator.driver
+        # Buffer the whole report and write it to the terminal once
+        with console:
+            console.print("🔍 Analyzing current page...")
             
-            try:
-                title = driver.title
-                url = driver.current_url
-                
-                # Count elements
-                links = len(driver.find_elements('tag name', 'a'))
-                buttons = len(driver.find_elements('tag name', 'button'))
-                inputs = len(driver.find_elements('tag name', 'input'))
-                forms = len(driver.find_elements('tag name', 'form'))
-                
-                table = Table(title="📋 Page Analysis")
-                table.add_column("Property", style="cyan")
-                table.add_column("Value", style="white")
-                
-                table.add_row("Title", title)
-                table.add_row("URL", url)
-                table.add_row("Links", str(links))
-                table.add_row("Buttons", str(buttons))
-                table.add_row("Input Fields", str(inputs))
-                table.add_row("Forms", str(forms))
-                
-                console.print(table)
+            # Get page info
+            if hasattr(self.automator, 'automator') and self.automator.automator and self.automator.automator.driver:
+                driver = self.automator.automator.driver
                 
-            except Exception as e:
-                console.print(f"❌ Analysis failed: {e}", style="red")
-        else:
-            console.print("❌ No active browser session", style="red")
+                try:
+                    title = driver.title
+                    url = driver.current_url
+                    
+                    # Count elements in a single round-trip
+                    links, buttons, inputs, forms = driver.execute_script(
+                        "return ['a', 'button', 'input', 'form'].map("
+                        "t => document.getElementsByTagName(t).length);"
+                    )
+                    
+                    table = Table(title="📋 Page Analysis")
+                    table.add_column("Property", style="cyan")
+                    table.add_column("Value", style="white")
+                    
+                    table.add_row("Title", title)
+                    table.add_row("URL", url)
+                    table.add_row("Links", str(links))
+                    table.add_row("Buttons", str(buttons))
+                    table.add_row("Input Fields", str(inputs))
+                    table.add_row("Forms", str(forms))
+                    
+                    console.print(table)
+                    
+                except Exception as e:
+                    console.print(f"❌ Analysis failed: {e}", style="red")
+            else:
+                console.print("❌ No active browser session", style="red")
         
         return True
     
@@ -329,13 +449,21 @@ class InteractiveWebAutomationService:
         ]
         
         for demo_name, demo_func in demos:
-            console.print(f"\n🔹 {demo_name}", style="bold blue")
-            demo_func()
-            time.sleep(2)  # Brief pause between demos
+            # Each step's output is rendered and flushed in one write
+            with console:
+                console.print(f"\n🔹 {demo_name}", style="bold blue")
+                demo_func()
+            # Move on as soon as the page has settled instead of a fixed pause
+            self.automator.wait_for_ready(timeout=5)
         
         console.print("\n✅ Demo completed!", style="green")
         return True
     
+    def cmd_help(self) -> bool:
+        """Show available commands"""
+        self.show_available_commands()
+        return True
+    
     def cmd_status(self) -> bool:
         """Show service status"""
         console.print(self.get_status_display())
@@ -373,10 +501,7 @@ class InteractiveWebAutomationService:
         while self.running:
             try:
                 # Get user command
-                command = Prompt.ask(
-                    "[bold cyan]web-automation[/bold cyan]",
-                    default="help"
-                )
+                command = self._read_command()
                 
                 # Execute command
                 if not self.execute_command(command):
@@ -401,14 +526,18 @@ def main():
     
     args = parser.parse_args()
     
+    # Load environment
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Load configuration
     try:
-        with open(args.config, 'r') as f:
-            config = json.load(f)
+        with open(args.config, 'rb') as f:
+            config = _json_loads(f.read())
     except FileNotFoundError:
         console.print(f"❌ Config file not found: {args.config}", style="red")
         return 1
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         console.print(f"❌ Invalid JSON in config file: {e}", style="red")
         return 1
     
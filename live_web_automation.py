@@ -9,38 +9,44 @@ Version: 3.0
 
 import os
 import sys
+import copy
 import json
 import time
 import logging
 import argparse
 import platform
+import queue
+import threading
+import random
+import re
+import importlib.util
 from typing import Optional, Dict, Any, List, Tuple
+from collections import deque, namedtuple
 from datetime import datetime
 from urllib.parse import urlparse
 from contextlib import contextmanager
-from functools import wraps
+from functools import wraps, lru_cache
 
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.logging import RichHandler
-from rich.prompt import Confirm
-from rich.table import Table
 
-# Selenium imports for proper API usage
+# Selenium names used by SafeWebAutomator; load_automation_stack() replaces
+# these fallbacks with the real ones before any browser work starts
+By = None
+Keys = None
+StaleElementReferenceException = Exception
+TimeoutException = Exception
+NoSuchElementException = Exception
+
 try:
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.common.keys import Keys
-    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    # Fallback for when selenium is not available
-    By = None
-    Keys = None
-    StaleElementReferenceException = Exception
-    TimeoutException = Exception
+    _json_loads = json.loads
 
-# Load environment
+# Load environment (before AutomationConfig reads the AUTOMATION_* variables)
 load_dotenv()
 
 # Setup logging
@@ -53,43 +59,60 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
-# Import enhanced modules with error handling
-try:
-    from src.pc_agent.claude_client import ClaudeClient
-    from src.pc_agent.web_automator import WebAutomator
-    IMPORTS_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Could not import automation modules: {e}")
-    IMPORTS_AVAILABLE = False
+# The automation stack (pc_agent modules, Selenium) is imported on first use by
+# load_automation_stack(), so --help and the capabilities overview stay fast.
+_STACK_LOADED = False
+IMPORTS_AVAILABLE = False
+SELENIUM_AVAILABLE = False
+WEBDRIVER_MANAGER_AVAILABLE = False
 
-# Selenium imports with fallback
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import (
-        WebDriverException,
-        NoSuchElementException,
-        TimeoutException,
-        StaleElementReferenceException
-    )
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    logger.warning("Selenium not installed. Install with: pip install selenium")
-    SELENIUM_AVAILABLE = False
 
-# WebDriver Manager for automatic driver management
-try:
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.firefox.service import Service as FirefoxService
-    from webdriver_manager.chrome import ChromeDriverManager
-    from webdriver_manager.firefox import GeckoDriverManager
-    WEBDRIVER_MANAGER_AVAILABLE = True
-except ImportError:
-    logger.warning("webdriver-manager not installed. Install with: pip install webdriver-manager")
-    WEBDRIVER_MANAGER_AVAILABLE = False
+def load_automation_stack() -> bool:
+    """Import the browser-automation dependencies into this module (once)
+    
+    Returns True when both the pc_agent modules and Selenium are importable.
+    """
+    global _STACK_LOADED, IMPORTS_AVAILABLE, SELENIUM_AVAILABLE, WEBDRIVER_MANAGER_AVAILABLE
+    global ClaudeClient, WebAutomator, BrowserPool, install_driver
+    global By, Keys, WebDriverWait
+    global NoSuchElementException, TimeoutException, StaleElementReferenceException
+    
+    if _STACK_LOADED:
+        return IMPORTS_AVAILABLE and SELENIUM_AVAILABLE
+    _STACK_LOADED = True
+    
+    # Import enhanced modules with error handling
+    try:
+        from src.pc_agent.claude_client import ClaudeClient
+        from src.pc_agent.web_automator import WebAutomator, install_driver
+        from src.pc_agent.browser_pool import BrowserPool
+        IMPORTS_AVAILABLE = True
+    except ImportError as e:
+        logger.warning(f"Could not import automation modules: {e}")
+        IMPORTS_AVAILABLE = False
+    
+    # Selenium imports with fallback
+    try:
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import (
+            NoSuchElementException,
+            TimeoutException,
+            StaleElementReferenceException
+        )
+        SELENIUM_AVAILABLE = True
+    except ImportError:
+        logger.warning("Selenium not installed. Install with: pip install selenium")
+        SELENIUM_AVAILABLE = False
+    
+    # WebDriver Manager for automatic driver management; only its presence
+    # matters here, web_automator imports it when a driver is installed
+    WEBDRIVER_MANAGER_AVAILABLE = importlib.util.find_spec("webdriver_manager") is not None
+    if not WEBDRIVER_MANAGER_AVAILABLE:
+        logger.warning("webdriver-manager not installed. Install with: pip install webdriver-manager")
+    
+    return IMPORTS_AVAILABLE and SELENIUM_AVAILABLE
 
 
 def measure_performance(func):
@@ -109,52 +132,92 @@ def measure_performance(func):
     return wrapper
 
 
+# http(s) URL with a non-empty host
+_URL_RE = re.compile(r'^https?://[^/?#\s]+', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _parse_selector(selector: str) -> Tuple[str, str]:
+    """Parse selector into Selenium By strategy, memoized per process"""
+    if selector.startswith("//"):
+        return (By.XPATH, selector)
+    elif selector.startswith("#"):
+        return (By.ID, selector[1:])
+    elif selector.startswith(".") and " " not in selector:
+        return (By.CLASS_NAME, selector[1:])
+    else:
+        return (By.CSS_SELECTOR, selector)
+
+
+# Session log entries; ts_ns is time.monotonic_ns(), see AutomationSession.to_datetime
+ActionEntry = namedtuple('ActionEntry', 'ts_ns action success details')
+ErrorEntry = namedtuple('ErrorEntry', 'ts_ns error traceback')
+PageVisit = namedtuple('PageVisit', 'ts_ns url')
+ScreenshotEntry = namedtuple('ScreenshotEntry', 'ts_ns filepath')
+
+
 class AutomationSession:
     """Track automation session state and metrics"""
     
+    __slots__ = (
+        'start_time', 'actions_performed', 'errors_encountered',
+        'screenshots_taken', 'pages_visited', '_pending', '_last_flush',
+        '_epoch_ns', '_mono0'
+    )
+    
+    # log_action buffers entries and moves them into actions_performed in
+    # one extend once this many are pending or this long has passed
+    FLUSH_MAX_PENDING = 256
+    FLUSH_INTERVAL = 0.05
+    
     def __init__(self):
         self.start_time = datetime.now()
+        # Wall-clock anchor for converting monotonic log timestamps
+        self._epoch_ns = time.time_ns()
+        self._mono0 = time.monotonic_ns()
         self.actions_performed = []
         self.errors_encountered = []
         self.screenshots_taken = []
         self.pages_visited = []
+        self._pending = deque()
+        self._last_flush = time.monotonic()
+    
+    def to_datetime(self, ts_ns: int) -> datetime:
+        """Convert a log entry's monotonic timestamp to wall-clock time"""
+        return datetime.fromtimestamp((self._epoch_ns + (ts_ns - self._mono0)) / 1e9)
+    
+    def _flush(self):
+        """Move buffered action entries into actions_performed"""
+        if self._pending:
+            self.actions_performed.extend(self._pending)
+            self._pending.clear()
+        self._last_flush = time.monotonic()
     
     def log_action(self, action: str, success: bool, details: str = ""):
         """Log an automation action"""
-        self.actions_performed.append({
-            'timestamp': datetime.now(),
-            'action': action,
-            'success': success,
-            'details': details
-        })
+        self._pending.append(ActionEntry(time.monotonic_ns(), action, success, details))
+        if (len(self._pending) >= self.FLUSH_MAX_PENDING
+                or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self._flush()
     
     def log_error(self, error: str, traceback_info: str = ""):
         """Log an error"""
-        self.errors_encountered.append({
-            'timestamp': datetime.now(),
-            'error': error,
-            'traceback': traceback_info
-        })
+        self.errors_encountered.append(ErrorEntry(time.monotonic_ns(), error, traceback_info))
     
     def log_page_visit(self, url: str):
         """Log a page visit"""
-        self.pages_visited.append({
-            'timestamp': datetime.now(),
-            'url': url
-        })
+        self.pages_visited.append(PageVisit(time.monotonic_ns(), url))
     
     def log_screenshot(self, filepath: str):
         """Log a screenshot"""
-        self.screenshots_taken.append({
-            'timestamp': datetime.now(),
-            'filepath': filepath
-        })
+        self.screenshots_taken.append(ScreenshotEntry(time.monotonic_ns(), filepath))
     
     def get_summary(self) -> Dict[str, Any]:
         """Get session summary"""
-        duration = (datetime.now() - self.start_time).total_seconds()
+        self._flush()
+        duration = (time.monotonic_ns() - self._mono0) / 1e9
         total_actions = len(self.actions_performed)
-        successful_actions = sum(1 for a in self.actions_performed if a['success'])
+        successful_actions = sum(1 for a in self.actions_performed if a.success)
         
         return {
             'duration_seconds': duration,
@@ -168,6 +231,8 @@ class AutomationSession:
     
     def display_summary(self):
         """Display session summary in a nice table"""
+        from rich.table import Table
+        
         summary = self.get_summary()
         
         table = Table(title="📊 Automation Session Summary")
@@ -196,15 +261,28 @@ class AutomationConfig:
         'screenshot_on_error': os.getenv('AUTOMATION_SCREENSHOT', 'true').lower() == 'true',
         'page_load_timeout': int(os.getenv('AUTOMATION_PAGE_TIMEOUT', '30')),
         'auto_driver_management': True,
-        'max_parallel_sessions': 3
+        'max_parallel_sessions': 3,
+        'inspection_pause': float(os.getenv('AUTOMATION_INSPECTION_PAUSE', '0'))
     }
     
+    # config_path -> (mtime, merged and validated config)
+    _cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
     @classmethod
     def load(cls, config_path: str = 'config.json') -> Dict[str, Any]:
-        """Load and validate configuration"""
+        """Load and validate configuration
+        
+        The parsed result is reused until the file's mtime changes; callers
+        always get their own copy.
+        """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            mtime = os.stat(config_path).st_mtime
+            cached = cls._cache.get(config_path)
+            if cached and cached[0] == mtime:
+                return copy.deepcopy(cached[1])
+            
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
             
             # Merge with defaults
             final_config = cls.DEFAULT_CONFIG.copy()
@@ -213,12 +291,13 @@ class AutomationConfig:
             # Validate
             cls._validate_config(final_config)
             
-            return final_config
+            cls._cache[config_path] = (mtime, final_config)
+            return copy.deepcopy(final_config)
             
         except FileNotFoundError:
             logger.warning(f"Config file {config_path} not found, using defaults")
             return cls.DEFAULT_CONFIG.copy()
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             logger.error(f"Invalid JSON in config file: {e}")
             raise
         except Exception as e:
@@ -239,8 +318,54 @@ class AutomationConfig:
             raise ValueError(f"browser must be one of: {valid_browsers}")
 
 
+# Install locations probed by check_browser_setup, per (browser, platform.system())
+_BROWSER_PATHS = {
+    ('chrome', 'Darwin'): (
+        "/Applications/Google Chrome.app",
+        "/Applications/Chromium.app"
+    ),
+    ('chrome', 'Windows'): (
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+    ),
+    ('chrome', 'Linux'): (
+        "/usr/bin/google-chrome",
+        "/usr/bin/chromium-browser",
+        "/usr/bin/chromium"
+    ),
+    ('firefox', 'Darwin'): ("/Applications/Firefox.app",),
+    ('firefox', 'Windows'): (
+        r"C:\Program Files\Mozilla Firefox\firefox.exe",
+        r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe"
+    ),
+    ('firefox', 'Linux'): ("/usr/bin/firefox",),
+    ('safari', 'Darwin'): ("/Applications/Safari.app",),
+}
+
+
+@lru_cache(maxsize=8)
+def _detect_browser(browser: str, system: str) -> bool:
+    """Check the known install locations for a browser, listing each parent
+    directory once instead of stat()ing every candidate path"""
+    if system not in ('Darwin', 'Windows'):
+        system = 'Linux'
+    
+    by_parent: Dict[str, set] = {}
+    for path in _BROWSER_PATHS.get((browser, system), ()):
+        by_parent.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+    
+    for parent, names in by_parent.items():
+        try:
+            if names & set(os.listdir(parent)):
+                return True
+        except OSError:
+            continue
+    return False
+
+
 def check_browser_setup(browser: str = 'chrome') -> bool:
     """Check if browser and driver are properly set up"""
+    load_automation_stack()
     console.print("🔍 Checking browser setup...")
     
     # Check webdriver-manager availability
@@ -256,24 +381,7 @@ def check_browser_setup(browser: str = 'chrome') -> bool:
     browser = browser.lower()
     
     if browser == 'chrome':
-        if system == "Darwin":  # macOS
-            chrome_paths = [
-                "/Applications/Google Chrome.app",
-                "/Applications/Chromium.app"
-            ]
-        elif system == "Windows":
-            chrome_paths = [
-                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
-            ]
-        else:  # Linux
-            chrome_paths = [
-                "/usr/bin/google-chrome",
-                "/usr/bin/chromium-browser",
-                "/usr/bin/chromium"
-            ]
-        
-        browser_found = any(os.path.exists(path) for path in chrome_paths)
+        browser_found = _detect_browser(browser, system)
         
         if browser_found:
             console.print("✅ Chrome browser detected")
@@ -282,17 +390,7 @@ def check_browser_setup(browser: str = 'chrome') -> bool:
             console.print("   Install from: https://www.google.com/chrome/")
     
     elif browser == 'firefox':
-        if system == "Darwin":
-            firefox_paths = ["/Applications/Firefox.app"]
-        elif system == "Windows":
-            firefox_paths = [
-                r"C:\Program Files\Mozilla Firefox\firefox.exe",
-                r"C:\Program Files (x86)\Mozilla Firefox\firefox.exe"
-            ]
-        else:
-            firefox_paths = ["/usr/bin/firefox"]
-        
-        browser_found = any(os.path.exists(path) for path in firefox_paths)
+        browser_found = _detect_browser(browser, system)
         
         if browser_found:
             console.print("✅ Firefox browser detected")
@@ -302,7 +400,7 @@ def check_browser_setup(browser: str = 'chrome') -> bool:
     
     elif browser == 'safari':
         if system == "Darwin":
-            browser_found = os.path.exists("/Applications/Safari.app")
+            browser_found = _detect_browser(browser, system)
             if browser_found:
                 console.print("✅ Safari browser detected")
             else:
@@ -322,15 +420,20 @@ class SafeWebAutomator:
     """Wrapper around WebAutomator with safety features and enhancements"""
     
     def __init__(self, config: Dict[str, Any], session: AutomationSession = None):
+        load_automation_stack()
         self.config = config
         self.automator = None
         self._initialized = False
         self.screenshots_dir = "screenshots"
         self.session = session or AutomationSession()
-        
-        # Create screenshots directory
-        if config.get('screenshot_on_error', True):
-            os.makedirs(self.screenshots_dir, exist_ok=True)
+        self._pool = None
+        # Selector -> WebElement from the current page; cleared on navigation
+        self._element_cache: Dict[str, Any] = {}
+        # Screenshot bytes waiting to be written by the background writer
+        self._screenshot_queue: Optional[queue.Queue] = None
+        self._screenshot_worker: Optional[threading.Thread] = None
+        # Screenshots directory is created by the first take_screenshot
+        self._screenshots_dir_ensured = False
     
     def initialize(self) -> bool:
         """Initialize web automator with error handling and auto driver management"""
@@ -342,7 +445,8 @@ class SafeWebAutomator:
             if self.config.get('auto_driver_management') and WEBDRIVER_MANAGER_AVAILABLE:
                 self._setup_auto_driver()
             
-            self.automator = WebAutomator(self.config)
+            self._pool = BrowserPool.for_config(self.config)
+            self.automator = self._pool.acquire(self.config)
             self._initialized = True
             logger.info("Web automator initialized successfully")
             self.session.log_action("initialize", True, "Web automator ready")
@@ -361,17 +465,30 @@ class SafeWebAutomator:
         try:
             if browser == 'chrome':
                 logger.info("Setting up Chrome driver automatically...")
-                driver_path = ChromeDriverManager().install()
+                driver_path = install_driver('chrome')
                 logger.info(f"Chrome driver installed: {driver_path}")
             elif browser == 'firefox':
                 logger.info("Setting up Firefox driver automatically...")
-                driver_path = GeckoDriverManager().install()
+                driver_path = install_driver('firefox')
                 logger.info(f"Firefox driver installed: {driver_path}")
         except Exception as e:
             logger.warning(f"Auto driver setup failed: {e}")
     
-    def is_valid_url(self, url: str) -> bool:
-        """Validate URL for safety"""
+    def is_valid_url(self, url: str, strict: bool = True) -> bool:
+        """Validate URL for safety
+        
+        With strict=False, URLs the fast regex rejects get a second look
+        from urlparse.
+        """
+        try:
+            if _URL_RE.match(url) is not None:
+                return True
+        except TypeError:
+            return False
+        
+        if strict:
+            return False
+        
         try:
             parsed = urlparse(url)
             return parsed.scheme in ['http', 'https'] and bool(parsed.netloc)
@@ -393,37 +510,69 @@ class SafeWebAutomator:
         
         max_retries = max_retries or self.config.get('max_retries', 3)
         
-        for attempt in range(max_retries):
+        # Elements from the previous page are about to go stale
+        self._element_cache.clear()
+        
+        success = self._retry(
+            "navigate", lambda: self.automator.navigate_to(url),
+            retriable=(Exception,), max_attempts=max_retries,
+            retry_falsy=True, pause=self._retry_pause,
+            details=f"Navigated to {url}"
+        )
+        if success:
+            self.session.log_page_visit(url)
+        return success
+    
+    def _retry(self, op: str, fn, retriable: Tuple[type, ...] = (),
+               max_attempts: int = 3, backoff: float = 0.1,
+               retry_falsy: bool = False, pause=None, details: str = "") -> bool:
+        """Run fn() with retries and log the outcome as a single action
+        
+        A retriable exception (or a falsy result, with retry_falsy) leads to
+        another attempt after backoff * 2**attempt seconds, or after
+        pause(attempt) when given. Any other exception ends the loop.
+        """
+        attempt = 0
+        for attempt in range(max_attempts):
             try:
-                success = self.automator.navigate_to(url)
-                if success:
-                    self.session.log_action("navigate", True, f"Navigated to {url}")
-                    self.session.log_page_visit(url)
+                if fn():
+                    self.session.log_action(op, True, details)
                     return True
-                
-                logger.warning(f"Navigation attempt {attempt + 1} failed")
-                time.sleep(1)  # Brief pause before retry
-                
-            except TimeoutException:
-                logger.warning(f"Navigation timeout on attempt {attempt + 1}")
-                self.session.log_error(f"Navigation timeout: {url}")
+                if not retry_falsy:
+                    break
+                logger.warning(f"{op} attempt {attempt + 1} failed")
+            except retriable as e:
+                logger.warning(f"{op} attempt {attempt + 1} failed: {e}")
+                self.session.log_error(f"{op} error: {e}")
             except Exception as e:
-                logger.error(f"Navigation error on attempt {attempt + 1}: {e}")
-                self.session.log_error(f"Navigation error: {e}")
+                logger.error(f"Error in {op}: {e}")
+                self.session.log_error(f"{op} error: {e}")
+                break
+            
+            if attempt + 1 < max_attempts:
+                if pause is not None:
+                    pause(attempt)
+                else:
+                    time.sleep(backoff * (2 ** attempt))
         
-        self.session.log_action("navigate", False, f"Failed after {max_retries} attempts")
+        self.session.log_action(op, False, f"Failed after {attempt + 1} attempt(s)")
         return False
     
-    def _parse_selector(self, selector: str) -> Tuple[str, str]:
-        """Parse selector into Selenium By strategy"""
-        if selector.startswith("//"):
-            return (By.XPATH, selector)
-        elif selector.startswith("#"):
-            return (By.ID, selector[1:])
-        elif selector.startswith(".") and " " not in selector:
-            return (By.CLASS_NAME, selector[1:])
-        else:
-            return (By.CSS_SELECTOR, selector)
+    def _retry_pause(self, attempt: int):
+        """Back off before a navigation retry: capped exponential delay with jitter"""
+        time.sleep(min(0.1 * (2 ** attempt) + random.uniform(0, 0.05), 2.0))
+    
+    def _cached_find(self, selector: str) -> Optional[Any]:
+        """Return the cached element for a selector if it is still attached"""
+        element = self._element_cache.get(selector)
+        if element is None:
+            return None
+        try:
+            element.is_enabled()  # cheap probe; raises if the node was replaced
+            return element
+        except (StaleElementReferenceException, AttributeError):
+            self._element_cache.pop(selector, None)
+            return None
     
     def wait_for_element(self, selector: str, timeout: int = None) -> bool:
         """Wait for element with proper timeout"""
@@ -451,6 +600,10 @@ class SafeWebAutomator:
             return None
         
         timeout = timeout or self.config.get('wait_timeout', 10)
+        
+        if hasattr(self.automator, 'driver'):
+            return self._poll_selectors(selectors, timeout)
+        
         timeout_per_selector = max(2, timeout // len(selectors))
         
         for selector in selectors:
@@ -467,7 +620,57 @@ class SafeWebAutomator:
                 continue
         
         logger.warning(f"Element not found with any of {len(selectors)} selectors")
-        self.session.log_action("wait_advanced", False, f"No selector matched")
+        self.session.log_action("wait_advanced", False, "No selector matched")
+        return None
+    
+    # Index of the first selector with a visible match, or -1. Selectors that
+    # the browser can't parse are skipped rather than aborting the check.
+    _FIRST_VISIBLE_JS = """
+        return arguments[0].findIndex(function (s) {
+            try {
+                var el = s.startsWith('//')
+                    ? document.evaluate(s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                    : document.querySelector(s);
+                // getClientRects is empty under display:none but, unlike
+                // offsetParent, not for position:fixed elements
+                return !!el && el.getClientRects().length > 0
+                    && getComputedStyle(el).visibility !== 'hidden';
+            } catch (e) {
+                return false;
+            }
+        });
+    """
+    
+    def _poll_selectors(self, selectors: List[str], timeout: float,
+                        interval: float = 0.1) -> Optional[Any]:
+        """Check all selectors in the page every interval until one is visible"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                index = self.automator.driver.execute_script(self._FIRST_VISIBLE_JS, selectors)
+            except Exception as e:
+                logger.debug(f"Selector poll failed: {e}")
+                index = -1
+            
+            if index is not None and index >= 0:
+                selector = selectors[index]
+                # Reuse the element from an earlier match if it's still attached
+                element = self._cached_find(selector)
+                if element is None:
+                    by, value = _parse_selector(selector)
+                    element = self.automator.find_element(value, by)
+                if element:
+                    self._element_cache[selector] = element
+                    logger.info(f"Element found with selector: {selector}")
+                    self.session.log_action("wait_advanced", True, f"Found: {selector}")
+                    return element
+            
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+        
+        logger.warning(f"Element not found with any of {len(selectors)} selectors")
+        self.session.log_action("wait_advanced", False, "No selector matched")
         return None
     
     def wait_for_clickable(self, selector: str, timeout: int = None) -> Optional[Any]:
@@ -478,11 +681,27 @@ class SafeWebAutomator:
         timeout = timeout or self.config.get('wait_timeout', 10)
         
         try:
+            element = self._cached_find(selector)
+            if element is not None and element.is_displayed() and element.is_enabled():
+                self.session.log_action("wait_clickable", True, f"Clickable (cached): {selector}")
+                return element
+            
             if hasattr(self.automator, 'driver'):
-                by, value = self._parse_selector(selector)
-                element = WebDriverWait(self.automator.driver, timeout).until(
-                    EC.element_to_be_clickable((by, value))
-                )
+                by, value = _parse_selector(selector)
+                
+                def first_clickable(driver):
+                    # find_elements returns [] instead of raising while absent
+                    found = driver.find_elements(by, value)
+                    if found and found[0].is_displayed() and found[0].is_enabled():
+                        return found[0]
+                    return False
+                
+                element = WebDriverWait(
+                    self.automator.driver, timeout,
+                    poll_frequency=0.1,
+                    ignored_exceptions=(StaleElementReferenceException,)
+                ).until(first_clickable)
+                self._element_cache[selector] = element
                 self.session.log_action("wait_clickable", True, f"Clickable: {selector}")
                 return element
         except TimeoutException:
@@ -494,13 +713,21 @@ class SafeWebAutomator:
             self.session.log_error(f"Clickable wait error: {e}")
             return None
     
-    def find_element(self, selector: str) -> Optional[Any]:
-        """Find element with error handling"""
+    def find_element(self, selector: str, refresh: bool = False) -> Optional[Any]:
+        """Find element with error handling
+        
+        Reuses the element found earlier for the same selector on this page
+        unless refresh=True.
+        """
         if not self._initialized or not self.automator:
             return None
         
         try:
-            element = self.automator.find_element(selector)
+            element = None if refresh else self._cached_find(selector)
+            if element is None:
+                element = self.automator.find_element(selector)
+                if element is not None:
+                    self._element_cache[selector] = element
             self.session.log_action("find_element", True, f"Found: {selector}")
             return element
         except NoSuchElementException:
@@ -527,53 +754,117 @@ class SafeWebAutomator:
             self.session.log_error(f"Find elements error: {e}")
             return []
     
+    def count_elements(self, selectors: Dict[str, str]) -> Dict[str, int]:
+        """Count matches for several CSS selectors in a single browser round-trip"""
+        if not self._initialized or not self.automator:
+            return {}
+        
+        try:
+            if hasattr(self.automator, 'count_elements_batch'):
+                counts = self.automator.count_elements_batch(selectors)
+            else:
+                counts = self.automator.driver.execute_script(
+                    "var s = arguments[0], r = {};"
+                    "for (var k in s) { r[k] = document.querySelectorAll(s[k]).length; }"
+                    "return r;",
+                    selectors
+                )
+            self.session.log_action("count_elements", True, f"Counted {len(selectors)} selectors")
+            return counts or {}
+        except Exception as e:
+            logger.error(f"Error counting elements: {e}")
+            self.session.log_error(f"Count elements error: {e}")
+            return {}
+    
+    def find_elements_with(self, selector: str,
+                           attrs: Tuple[str, ...] = ('text', 'href')) -> List[Dict[str, Any]]:
+        """Read text/attributes of every element matching a CSS selector in one call
+        
+        Returns plain dicts (one per element, keyed by attr; 'text' is the
+        rendered text). They are snapshots, not live WebElements.
+        """
+        if not self._initialized or not self.automator:
+            return []
+        
+        try:
+            if hasattr(self.automator, 'driver'):
+                try:
+                    items = self.automator.driver.execute_script(
+                        "var attrs = arguments[1];"
+                        "return Array.from(document.querySelectorAll(arguments[0])).map(function (e) {"
+                        "  var item = {};"
+                        "  attrs.forEach(function (a) { item[a] = a === 'text' ? e.innerText : e.getAttribute(a); });"
+                        "  return item;"
+                        "});",
+                        selector, list(attrs)
+                    )
+                    self.session.log_action("find_elements_with", True, f"Read {len(items)}: {selector}")
+                    return items
+                except Exception as e:
+                    logger.debug(f"Batched read failed, reading elements one by one: {e}")
+            
+            items = [
+                {a: (element.text if a == 'text' else element.get_attribute(a)) for a in attrs}
+                for element in self.find_elements(selector)
+            ]
+            self.session.log_action("find_elements_with", True, f"Read {len(items)}: {selector}")
+            return items
+        except Exception as e:
+            logger.error(f"Error reading elements: {e}")
+            self.session.log_error(f"Find elements error: {e}")
+            return []
+    
     def type_text(self, selector: str, text: str, clear_first: bool = True) -> bool:
         """Type text with proper error handling"""
         if not self._initialized or not self.automator:
             return False
         
-        try:
-            # Use correct parameter order: selector, text, by, clear_first
-            # Fallback to string "css selector" if By is not available
-            by_method = By.CSS_SELECTOR if By else "css selector"
-            success = self.automator.type_in_element(selector, text, by_method, clear_first)
-            self.session.log_action("type_text", success, f"Typed in {selector}")
-            return success
-        except StaleElementReferenceException:
-            logger.warning("Element became stale, retrying...")
-            time.sleep(0.5)
+        def attempt() -> bool:
+            element = self._cached_find(selector)
             try:
+                if element is not None:
+                    if clear_first:
+                        element.clear()
+                    element.send_keys(text)
+                    return True
+                # Use correct parameter order: selector, text, by, clear_first
+                # Fallback to string "css selector" if By is not available
                 by_method = By.CSS_SELECTOR if By else "css selector"
-                success = self.automator.type_in_element(selector, text, by_method, clear_first)
-                self.session.log_action("type_text", success, f"Typed (retry) in {selector}")
-                return success
-            except Exception as e:
-                logger.error(f"Retry failed: {e}")
-                self.session.log_error(f"Type text retry error: {e}")
-                return False
-        except Exception as e:
-            logger.error(f"Error typing text: {e}")
-            self.session.log_error(f"Type text error: {e}")
-            return False
+                return self.automator.type_in_element(selector, text, by_method, clear_first)
+            except StaleElementReferenceException:
+                self._element_cache.pop(selector, None)
+                raise
+        
+        return self._retry(
+            "type_text", attempt,
+            retriable=(StaleElementReferenceException,), max_attempts=2,
+            details=f"Typed in {selector}"
+        )
     
     def click_element(self, selector: str, wait_clickable: bool = True) -> bool:
         """Click element with proper error handling"""
         if not self._initialized or not self.automator:
             return False
         
-        try:
-            if wait_clickable:
-                element = self.wait_for_clickable(selector)
-                if not element:
-                    return False
+        def attempt() -> bool:
+            if not wait_clickable:
+                return self.automator.click_element(selector)
             
-            success = self.automator.click_element(selector)
-            self.session.log_action("click", success, f"Clicked: {selector}")
-            return success
-        except Exception as e:
-            logger.error(f"Error clicking element: {e}")
-            self.session.log_error(f"Click error: {e}")
-            return False
+            element = self.wait_for_clickable(selector)
+            if not element:
+                return False
+            try:
+                element.click()
+                return True
+            except StaleElementReferenceException:
+                self._element_cache.pop(selector, None)
+                raise
+        
+        return self._retry(
+            "click", attempt,
+            retriable=(StaleElementReferenceException,), max_attempts=2,
+            details=f"Clicked: {selector}"
+        )
     
     def press_key(self, selector: str, key: str) -> bool:
         """Press key in element using WebAutomator abstraction"""
@@ -608,8 +899,85 @@ class SafeWebAutomator:
             self.session.log_error(f"Press key error: {e}")
             return False
     
+    # Runs a list of type/click actions in the page. Values are set through the
+    # prototype's value setter so framework-controlled inputs (React etc.) see
+    # the change, then input/change events are fired as a user edit would.
+    _BULK_ACTIONS_JS = """
+        return arguments[0].map(function (action) {
+            try {
+                var el = document.querySelector(action.selector);
+                if (!el) { return {ok: false, error: 'not found'}; }
+                if (action.type === 'type') {
+                    var text = (action.clear_first === false ? el.value : '') + action.text;
+                    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+                    if (setter && setter.set) { setter.set.call(el, text); } else { el.value = text; }
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                } else if (action.type === 'click') {
+                    el.click();
+                } else {
+                    return {ok: false, error: 'unknown action type: ' + action.type};
+                }
+                return {ok: true};
+            } catch (e) {
+                return {ok: false, error: String(e)};
+            }
+        });
+    """
+    
+    def bulk_actions(self, actions: List[Dict[str, Any]]) -> bool:
+        """Run several type/click actions in one browser round trip
+        
+        Each action is a dict like {'type': 'type', 'selector': ..., 'text': ...,
+        'clear_first': True} or {'type': 'click', 'selector': ...}. Selectors
+        must be CSS. Actions the in-page script couldn't perform are retried
+        one at a time through type_text/click_element.
+        """
+        if not self._initialized or not self.automator:
+            return False
+        
+        if not actions:
+            return True
+        
+        try:
+            results = None
+            if hasattr(self.automator, 'driver'):
+                try:
+                    results = self.automator.driver.execute_script(self._BULK_ACTIONS_JS, actions)
+                except Exception as e:
+                    logger.debug(f"Bulk action script failed, running actions individually: {e}")
+            
+            results = results or [{'ok': False}] * len(actions)
+            succeeded = 0
+            for action, result in zip(actions, results):
+                if result.get('ok'):
+                    succeeded += 1
+                    continue
+                
+                if action.get('type') == 'type':
+                    ok = self.type_text(action['selector'], action.get('text', ''),
+                                        action.get('clear_first', True))
+                elif action.get('type') == 'click':
+                    ok = self.click_element(action['selector'])
+                else:
+                    logger.warning(f"Unknown bulk action type: {action.get('type')}")
+                    ok = False
+                succeeded += ok
+            
+            success = succeeded == len(actions)
+            self.session.log_action("bulk_actions", success, f"{succeeded}/{len(actions)} actions succeeded")
+            return success
+        except Exception as e:
+            logger.error(f"Error running bulk actions: {e}")
+            self.session.log_error(f"Bulk actions error: {e}")
+            return False
+    
     def take_screenshot(self, name: str = None) -> Optional[str]:
-        """Take screenshot for debugging"""
+        """Take screenshot for debugging
+        
+        Captured bytes are written by a background thread, so the returned path
+        may not exist yet; it is logged and recorded in the session once written.
+        """
         if not self._initialized or not self.automator:
             return None
         
@@ -618,15 +986,23 @@ class SafeWebAutomator:
             filename = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
             filepath = os.path.join(self.screenshots_dir, filename)
             
-            if hasattr(self.automator, 'take_screenshot'):
-                self.automator.take_screenshot(filepath)
+            if not self._screenshots_dir_ensured:
+                os.makedirs(self.screenshots_dir, exist_ok=True)
+                self._screenshots_dir_ensured = True
+            
+            if hasattr(self.automator, 'get_screenshot_bytes'):
+                data = self.automator.get_screenshot_bytes()
+                if data is None:
+                    return None
+                self._queue_screenshot(filepath, data)
             elif hasattr(self.automator, 'driver'):
-                self.automator.driver.save_screenshot(filepath)
+                self._queue_screenshot(filepath, self.automator.driver.get_screenshot_as_png())
+            elif hasattr(self.automator, 'take_screenshot'):
+                self.automator.take_screenshot(filepath)
+                self._screenshot_saved(filepath)
             else:
                 return None
             
-            logger.info(f"Screenshot saved: {filepath}")
-            self.session.log_screenshot(filepath)
             return filepath
             
         except Exception as e:
@@ -634,6 +1010,60 @@ class SafeWebAutomator:
             self.session.log_error(f"Screenshot error: {e}")
             return None
     
+    def _queue_screenshot(self, filepath: str, data: bytes):
+        """Hand screenshot bytes to the writer thread, starting it on first use"""
+        if self._screenshot_worker is None:
+            self._screenshot_queue = queue.Queue()
+            self._screenshot_worker = threading.Thread(
+                target=self._drain_screenshots, name="screenshot-writer", daemon=True
+            )
+            self._screenshot_worker.start()
+        self._screenshot_queue.put((filepath, data))
+        logger.debug(f"Screenshot queued: {filepath}")
+    
+    def _screenshot_saved(self, filepath: str):
+        logger.info(f"Screenshot saved: {filepath}")
+        self.session.log_screenshot(filepath)
+    
+    def _drain_screenshots(self):
+        """Writer thread: write queued screenshots until the None sentinel"""
+        while True:
+            item = self._screenshot_queue.get()
+            if item is None:
+                break
+            filepath, data = item
+            try:
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+            except OSError as e:
+                logger.error(f"Failed to write screenshot {filepath}: {e}")
+                self.session.log_error(f"Screenshot error: {e}")
+            else:
+                self._screenshot_saved(filepath)
+    
+    def wait_until_ready(self, selector: Optional[str] = None, timeout: int = None) -> bool:
+        """Wait until the page has loaded and, if given, selector is present"""
+        if not self._initialized or not self.automator:
+            return False
+        
+        timeout = timeout or self.config.get('wait_timeout', 10)
+        
+        try:
+            if hasattr(self.automator, 'wait_for_ready'):
+                return self.automator.wait_for_ready(timeout=timeout, selector=selector)
+            
+            by, value = _parse_selector(selector or "body")
+            WebDriverWait(self.automator.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.find_elements(by, value)
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"Page not ready within {timeout}s")
+            return False
+        except Exception as e:
+            logger.error(f"Error waiting for page: {e}")
+            return False
+    
     def get_console_logs(self) -> List[Dict]:
         """Capture browser console logs"""
         if not self._initialized or not self.automator:
@@ -654,10 +1084,17 @@ class SafeWebAutomator:
             return {}
         
         try:
-            info = {
-                'url': self.automator.get_current_url(),
-                'title': self.automator.get_page_title()
-            }
+            if getattr(self.automator, 'driver', None) is not None:
+                # One round trip instead of separate current_url/title calls
+                info = self.automator.driver.execute_script(
+                    "return {url: location.href, title: document.title, "
+                    "readyState: document.readyState};"
+                )
+            else:
+                info = {
+                    'url': self.automator.get_current_url(),
+                    'title': self.automator.get_page_title()
+                }
             self.session.log_action("get_page_info", True, f"Got info for {info.get('url')}")
             return info
         except Exception as e:
@@ -665,11 +1102,26 @@ class SafeWebAutomator:
             self.session.log_error(f"Page info error: {e}")
             return {}
     
-    def cleanup(self):
-        """Clean up resources"""
+    def cleanup(self, keep_warm: bool = False):
+        """Clean up resources
+        
+        The browser is quit unless keep_warm is set, in which case it is parked
+        in the shared BrowserPool for the next session in this process.
+        """
+        self._element_cache.clear()
+        
+        # Let queued screenshots reach disk before the process can exit
+        if self._screenshot_worker is not None:
+            self._screenshot_queue.put(None)
+            self._screenshot_worker.join(timeout=10)
+            self._screenshot_worker = None
+        
         if self._initialized and self.automator:
             try:
-                self.automator.cleanup()
+                if keep_warm:
+                    self._pool.release(self.automator)
+                else:
+                    self._pool.discard(self.automator)
                 logger.info("Web automator cleaned up successfully")
                 self.session.log_action("cleanup", True, "Resources cleaned up")
             except Exception as e:
@@ -681,8 +1133,10 @@ class SafeWebAutomator:
 
 
 @contextmanager
-def automation_session(config: Dict[str, Any], session: AutomationSession = None):
-    """Context manager for safe automation sessions"""
+def automation_session(config: Dict[str, Any], session: AutomationSession = None,
+                       keep_warm: bool = False):
+    """Context manager for safe automation sessions (keep_warm: park the
+    browser for a later session instead of quitting it)"""
     session = session or AutomationSession()
     automator = SafeWebAutomator(config, session)
     
@@ -695,21 +1149,32 @@ def automation_session(config: Dict[str, Any], session: AutomationSession = None
         console.print("\n⚠️ Interrupted by user", style="bold yellow")
         raise
     finally:
-        automator.cleanup()
+        automator.cleanup(keep_warm)
 
 
 def confirm_live_automation(auto_confirm: bool = False) -> bool:
-    """Ask user to confirm live browser automation"""
-    if auto_confirm:
+    """Ask user to confirm live browser automation
+    
+    PC_AGENT_AUTO_CONFIRM=1 confirms like --yes. Without a terminal on stdin
+    there is nobody to ask, so the prompt's default (decline) is taken.
+    """
+    if auto_confirm or os.getenv('PC_AGENT_AUTO_CONFIRM') == '1':
         return True
     
-    console.print(Panel.fit(
-        "⚠️ LIVE WEB AUTOMATION WARNING ⚠️\n\n"
-        "This will open a real browser and perform actual web interactions.\n"
-        "Make sure you're ready for browser windows to open and navigate.\n\n"
-        "Do you want to continue?",
-        style="bold yellow"
-    ))
+    if not sys.stdin.isatty():
+        console.print("❌ No terminal to confirm live automation - use --yes or PC_AGENT_AUTO_CONFIRM=1")
+        return False
+    
+    if console.is_terminal:
+        console.print(Panel.fit(
+            "⚠️ LIVE WEB AUTOMATION WARNING ⚠️\n\n"
+            "This will open a real browser and perform actual web interactions.\n"
+            "Make sure you're ready for browser windows to open and navigate.\n\n"
+            "Do you want to continue?",
+            style="bold yellow"
+        ))
+    
+    from rich.prompt import Confirm
     
     try:
         return Confirm.ask("Continue with live automation?", default=False)
@@ -718,6 +1183,18 @@ def confirm_live_automation(auto_confirm: bool = False) -> bool:
         return False
 
 
+def inspection_pause(automator: SafeWebAutomator, message: str):
+    """Hold the browser on screen for inspection_pause seconds (config or --inspect);
+    skipped when it is 0 or output isn't a terminal, i.e. nobody is watching"""
+    seconds = automator.config.get('inspection_pause', 0)
+    if not seconds or not console.is_terminal:
+        return
+    
+    console.print(f"👀 [bold yellow]VISUAL INSPECTION: {message}[/bold yellow]")
+    console.print(f"⏸️ Pausing for {seconds:g} seconds...")
+    time.sleep(seconds)
+
+
 def example_1_basic_navigation(automator: SafeWebAutomator) -> bool:
     """Example 1: Basic Navigation"""
     console.print(Panel.fit("📍 Example 1: Basic Navigation", style="bold cyan"))
@@ -726,6 +1203,7 @@ def example_1_basic_navigation(automator: SafeWebAutomator) -> bool:
         url = "https://example.com"
         console.print(f"Navigating to {url}...")
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -789,11 +1267,9 @@ def example_2_search_automation(automator: SafeWebAutomator, claude: Optional[An
         
         console.print("✅ Reached DuckDuckGo")
         
-        # VISUAL INSPECTION PAUSE - Let user see the DuckDuckGo page
-        console.print("👀 [bold yellow]VISUAL INSPECTION: Browser window is now open with DuckDuckGo[/bold yellow]")
-        console.print("📍 You can now see the DuckDuckGo page in the Safari browser window")
-        console.print("⏸️ Pausing for 10 seconds so you can inspect the page...")
-        time.sleep(10)
+        # Continue as soon as the search box is in the DOM
+        automator.wait_until_ready("input[name='q']", timeout=10)
+        inspection_pause(automator, "Browser window is now open with DuckDuckGo")
         
         # Wait for search box to be ready - try multiple selectors
         console.print("🔍 Waiting for search input...")
@@ -809,9 +1285,7 @@ def example_2_search_automation(automator: SafeWebAutomator, claude: Optional[An
         
         if not search_element:
             console.print("❌ Search box not found", style="bold red")
-            console.print("👀 [bold yellow]VISUAL INSPECTION: Check if you can see the search box in the browser window[/bold yellow]")
-            console.print("⏸️ Pausing for 15 seconds so you can inspect what DuckDuckGo looks like...")
-            time.sleep(15)
+            inspection_pause(automator, "Check if you can see the search box in the browser window")
             automator.take_screenshot("search_box_not_found")
             return False
         
@@ -855,10 +1329,7 @@ def example_2_search_automation(automator: SafeWebAutomator, claude: Optional[An
         page_info = automator.get_page_info()
         console.print(f"   Results URL: {page_info.get('url', 'Unknown')}")
         
-        # VISUAL INSPECTION PAUSE - Let user see the search results
-        console.print("👀 [bold yellow]VISUAL INSPECTION: You can now see the search results (if any)[/bold yellow]")
-        console.print("⏸️ Pausing for 10 seconds so you can inspect the results...")
-        time.sleep(10)
+        inspection_pause(automator, "You can now see the search results (if any)")
         
         return True
 
@@ -886,6 +1357,7 @@ def example_3_element_detection(automator: SafeWebAutomator) -> bool:
             ("Input Fields", "input", "Input elements")
         ]
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -894,18 +1366,19 @@ def example_3_element_detection(automator: SafeWebAutomator) -> bool:
         ) as progress:
             task = progress.add_task("Detecting elements...", total=len(element_types))
             
+            # One in-page evaluation for every selector instead of a
+            # find_elements round trip each
+            counts = automator.count_elements(
+                {name: selector for name, selector, _ in element_types}
+            )
+            
             elements_found = []
-            for name, selector, description in element_types:
-                try:
-                    elements = automator.find_elements(selector)
-                    count = len(elements)
-                    elements_found.append((name, count, description))
-                    
-                    if count > 0:
-                        logger.info(f"Found {count} {name.lower()}")
-                except Exception as e:
-                    logger.warning(f"Error finding {name}: {e}")
-                    elements_found.append((name, 0, description))
+            for name, _, description in element_types:
+                count = counts.get(name, 0)
+                elements_found.append((name, count, description))
+                
+                if count > 0:
+                    logger.info(f"Found {count} {name.lower()}")
                 
                 progress.advance(task)
         
@@ -935,6 +1408,7 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
     ))
     
     # Check dependencies
+    load_automation_stack()
     if not IMPORTS_AVAILABLE:
         console.print("❌ Required modules not available", style="bold red")
         console.print("Install with: pip install -r requirements.txt")
@@ -1018,6 +1492,7 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
 def health_check(config: Dict[str, Any]) -> bool:
     """Run a quick health check of the automation system"""
     console.print(Panel.fit("🏥 Running System Health Check", style="bold cyan"))
+    load_automation_stack()
     
     checks = {
         'Python version': sys.version_info >= (3, 7),
@@ -1137,6 +1612,7 @@ def show_capabilities():
         "  --live           Run live automation examples\n"
         "  --headless       Run browser in headless mode\n"
         "  --yes            Skip confirmation prompt\n"
+        "  --inspect SECS   Pause for visual inspection\n"
         "  --health-check   Run system health check\n"
         "  --config PATH    Custom config file path\n\n"
         "New in v3.0:\n"
@@ -1168,7 +1644,13 @@ def main():
     parser.add_argument(
         '--yes', '-y',
         action='store_true',
-        help='Skip confirmation prompt'
+        help='Skip confirmation prompt (or set PC_AGENT_AUTO_CONFIRM=1)'
+    )
+    parser.add_argument(
+        '--inspect',
+        type=float,
+        metavar='SECONDS',
+        help='Pause for visual inspection during the search example'
     )
     parser.add_argument(
         '--health-check',
@@ -1190,6 +1672,8 @@ def main():
         # Override with CLI arguments
         if args.headless:
             config['headless'] = True
+        if args.inspect is not None:
+            config['inspection_pause'] = args.inspect
         
         # Run health check if requested
         if args.health_check:
@@ -13,21 +13,31 @@ import json
 import time
 import logging
 import argparse
+import itertools
 import platform
+import socket
+import multiprocessing
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from urllib.parse import urlparse
-from contextlib import contextmanager
-from functools import wraps
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+from dataclasses import dataclass, fields
 
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.logging import RichHandler
 from rich.prompt import Confirm
 from rich.table import Table
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment
 load_dotenv()
 
@@ -41,43 +51,106 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
-# Import enhanced modules with error handling
-try:
-    from src.pc_agent.claude_client import ClaudeClient
-    from src.pc_agent.web_automator import WebAutomator
-    IMPORTS_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Could not import automation modules: {e}")
-    IMPORTS_AVAILABLE = False
-
-# Selenium imports with fallback
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import (
-        WebDriverException,
-        NoSuchElementException,
-        TimeoutException,
-        StaleElementReferenceException
-    )
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    logger.warning("Selenium not installed. Install with: pip install selenium")
-    SELENIUM_AVAILABLE = False
+# The automation stack (pc_agent modules, Selenium, webdriver-manager) is imported
+# on first use by load_automation_stack(), so the default capabilities overview
+# and --help don't pay for it. The availability flags are filled in then.
+_STACK_LOADED = False
+IMPORTS_AVAILABLE = False
+SELENIUM_AVAILABLE = False
+WEBDRIVER_MANAGER_AVAILABLE = False
 
-# WebDriver Manager for automatic driver management
-try:
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.firefox.service import Service as FirefoxService
-    from webdriver_manager.chrome import ChromeDriverManager
-    from webdriver_manager.firefox import GeckoDriverManager
-    WEBDRIVER_MANAGER_AVAILABLE = True
-except ImportError:
-    logger.warning("webdriver-manager not installed. Install with: pip install webdriver-manager")
-    WEBDRIVER_MANAGER_AVAILABLE = False
+
+def load_automation_stack() -> bool:
+    """Import the browser-automation dependencies into this module (once)
+    
+    Returns True when both the pc_agent modules and Selenium are importable.
+    """
+    global _STACK_LOADED, IMPORTS_AVAILABLE, SELENIUM_AVAILABLE, WEBDRIVER_MANAGER_AVAILABLE
+    global ClaudeClient, WebAutomator, BrowserPool
+    global webdriver, Keys, By, WebDriverWait, EC, _KEY_MAPPING
+    global WebDriverException, NoSuchElementException, TimeoutException, StaleElementReferenceException
+    global ChromeService, FirefoxService, ChromeDriverManager, GeckoDriverManager
+    
+    if _STACK_LOADED:
+        return IMPORTS_AVAILABLE and SELENIUM_AVAILABLE
+    _STACK_LOADED = True
+    
+    # Import enhanced modules with error handling
+    try:
+        from src.pc_agent.claude_client import ClaudeClient
+        from src.pc_agent.web_automator import WebAutomator
+        from src.pc_agent.browser_pool import BrowserPool
+        IMPORTS_AVAILABLE = True
+    except ImportError as e:
+        logger.warning(f"Could not import automation modules: {e}")
+        IMPORTS_AVAILABLE = False
+    
+    # Selenium imports with fallback
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import (
+            WebDriverException,
+            NoSuchElementException,
+            TimeoutException,
+            StaleElementReferenceException
+        )
+        SELENIUM_AVAILABLE = True
+        
+        # Key names accepted by SafeWebAutomator.press_key
+        _KEY_MAPPING = {
+            'ENTER': Keys.RETURN,
+            'RETURN': Keys.RETURN,
+            'TAB': Keys.TAB,
+            'ESC': Keys.ESCAPE,
+            'ESCAPE': Keys.ESCAPE
+        }
+    except ImportError:
+        logger.warning("Selenium not installed. Install with: pip install selenium")
+        SELENIUM_AVAILABLE = False
+    
+    # WebDriver Manager for automatic driver management
+    try:
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        from webdriver_manager.chrome import ChromeDriverManager
+        from webdriver_manager.firefox import GeckoDriverManager
+        WEBDRIVER_MANAGER_AVAILABLE = True
+    except ImportError:
+        logger.warning("webdriver-manager not installed. Install with: pip install webdriver-manager")
+        WEBDRIVER_MANAGER_AVAILABLE = False
+    
+    return IMPORTS_AVAILABLE and SELENIUM_AVAILABLE
+
+
+class _NoopProgress:
+    """Stand-in for rich Progress when output is not a terminal"""
+    
+    def add_task(self, *args, **kwargs) -> int:
+        return 0
+    
+    def advance(self, *args, **kwargs):
+        pass
+    
+    def remove_task(self, *args, **kwargs):
+        pass
+
+
+def progress_spinner():
+    """Spinner with a task description for interactive terminals; a no-op (no
+    refresh thread, no ANSI repaints) when output is redirected, e.g. in CI logs"""
+    if not console.is_terminal:
+        return nullcontext(_NoopProgress())
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
 
 
 def measure_performance(func):
@@ -97,6 +170,64 @@ def measure_performance(func):
     return wrapper
 
 
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> Tuple[str, str]:
+    """Map a selector string to its (By, value) locator, memoized per process"""
+    if selector.startswith("//"):
+        return (By.XPATH, selector)
+    elif selector.startswith("#"):
+        return (By.ID, selector[1:])
+    elif selector.startswith(".") and " " not in selector:
+        return (By.CLASS_NAME, selector[1:])
+    else:
+        return (By.CSS_SELECTOR, selector)
+
+
+@lru_cache(maxsize=1024)
+def _validate_url(url: str) -> bool:
+    """Check that a URL is http(s) with a host, memoized per process"""
+    if not isinstance(url, str):
+        return False
+    
+    # Fast path for the usual lowercase http(s):// form; anything else
+    # (mixed-case schemes, odd inputs) goes through urlparse
+    if url.startswith(('http://', 'https://')):
+        rest = url.split('://', 1)[1]
+        for sep in '/?#':
+            rest = rest.split(sep, 1)[0]
+        return bool(rest)
+    
+    try:
+        parsed = urlparse(url)
+        return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
+    except Exception:
+        return False
+
+
+def _write_bytes(filepath: str, data: bytes):
+    """Write a captured screenshot to disk (runs on the screenshot writer thread)"""
+    try:
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        logger.info(f"Screenshot saved: {filepath}")
+    except OSError as e:
+        logger.error(f"Failed to write screenshot {filepath}: {e}")
+
+
+def _preload_host(host: str, port: int = 443, timeout: float = 3.0):
+    """Resolve a host and open (then drop) a TCP connection to it, so the
+    resolver cache and route are warm before the browser's first visit"""
+    try:
+        family, socktype, proto, _, address = socket.getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )[0]
+        with socket.socket(family, socktype, proto) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+    except OSError as e:
+        logger.debug(f"Preloading {host} failed: {e}")
+
+
 class AutomationSession:
     """Track automation session state and metrics"""
     
@@ -138,6 +269,13 @@ class AutomationSession:
             'filepath': filepath
         })
     
+    def merge(self, other: 'AutomationSession'):
+        """Fold another session's records (e.g. from a worker process) into this one"""
+        self.actions_performed.extend(other.actions_performed)
+        self.errors_encountered.extend(other.errors_encountered)
+        self.screenshots_taken.extend(other.screenshots_taken)
+        self.pages_visited.extend(other.pages_visited)
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get session summary"""
         duration = (datetime.now() - self.start_time).total_seconds()
@@ -184,15 +322,23 @@ class AutomationConfig:
         'screenshot_on_error': os.getenv('AUTOMATION_SCREENSHOT', 'true').lower() == 'true',
         'page_load_timeout': int(os.getenv('AUTOMATION_PAGE_TIMEOUT', '30')),
         'auto_driver_management': True,
-        'max_parallel_sessions': 3
+        'max_parallel_sessions': 3,
+        'retry_backoff_cap': float(os.getenv('AUTOMATION_RETRY_BACKOFF_CAP', '4.0')),
+        'demo_mode': os.getenv('AUTOMATION_DEMO_MODE', 'false').lower() == 'true',
+        'poll_frequency': float(os.getenv('AUTOMATION_POLL_FREQUENCY', '0.05')),
+        # Opt-in: hosts to warm up on initialize, e.g. "example.com,duckduckgo.com"
+        'preload_hosts': [
+            h.strip() for h in os.getenv('AUTOMATION_PRELOAD_HOSTS', '').split(',')
+            if h.strip()
+        ]
     }
     
     @classmethod
     def load(cls, config_path: str = 'config.json') -> Dict[str, Any]:
         """Load and validate configuration"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
             
             # Merge with defaults
             final_config = cls.DEFAULT_CONFIG.copy()
@@ -206,7 +352,7 @@ class AutomationConfig:
         except FileNotFoundError:
             logger.warning(f"Config file {config_path} not found, using defaults")
             return cls.DEFAULT_CONFIG.copy()
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             logger.error(f"Invalid JSON in config file: {e}")
             raise
         except Exception as e:
@@ -227,8 +373,39 @@ class AutomationConfig:
             raise ValueError(f"browser must be one of: {valid_browsers}")
 
 
+@dataclass(frozen=True)
+class AutomatorSettings:
+    """Typed, read-only view of the settings SafeWebAutomator consults on hot paths
+    
+    Resolved once from the config dict so retry and wait loops read plain
+    attributes instead of repeating dict lookups with inline defaults. The
+    dict itself is still passed through to WebAutomator and ClaudeClient,
+    which accept arbitrary extra keys.
+    """
+    browser: str = 'chrome'
+    headless: bool = False
+    wait_timeout: int = 10
+    max_retries: int = 3
+    screenshot_on_error: bool = True
+    page_load_timeout: int = 30
+    auto_driver_management: bool = False
+    retry_backoff_cap: float = 4.0
+    demo_mode: bool = False
+    poll_frequency: float = 0.05
+    preload_hosts: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'AutomatorSettings':
+        """Pick the known keys out of a config dict, ignoring the rest"""
+        values = {f.name: config[f.name] for f in fields(cls) if f.name in config}
+        # JSON configs give a list; keep the frozen settings immutable
+        values['preload_hosts'] = tuple(values.get('preload_hosts') or ())
+        return cls(**values)
+
+
 def check_browser_setup(browser: str = 'chrome') -> bool:
     """Check if browser and driver are properly set up"""
+    load_automation_stack()
     console.print("🔍 Checking browser setup...")
     
     # Check webdriver-manager availability
@@ -309,15 +486,28 @@ def check_browser_setup(browser: str = 'chrome') -> bool:
 class SafeWebAutomator:
     """Wrapper around WebAutomator with safety features and enhancements"""
     
+    # Capability bits for the wrapped automator, probed once in initialize()
+    CAP_PRESS_KEY = 1 << 0
+    CAP_SCREENSHOT_BYTES = 1 << 1
+    CAP_DRIVER = 1 << 2
+    CAP_PAGE_INFO = 1 << 3
+    
     def __init__(self, config: Dict[str, Any], session: AutomationSession = None):
+        load_automation_stack()
         self.config = config
+        self.settings = AutomatorSettings.from_dict(config)
         self.automator = None
         self._initialized = False
         self.screenshots_dir = "screenshots"
         self.session = session or AutomationSession()
+        self._pool = None
+        self._caps = 0
+        self._screenshot_writer = None
+        self._shot_counter = itertools.count()
+        self._session_stamp = int(time.time())
         
         # Create screenshots directory
-        if config.get('screenshot_on_error', True):
+        if self.settings.screenshot_on_error:
             os.makedirs(self.screenshots_dir, exist_ok=True)
     
     def initialize(self) -> bool:
@@ -327,10 +517,20 @@ class SafeWebAutomator:
                 raise ImportError("Web automation modules not available")
             
             # If auto driver management is enabled and available, use it
-            if self.config.get('auto_driver_management') and WEBDRIVER_MANAGER_AVAILABLE:
+            if self.settings.auto_driver_management and WEBDRIVER_MANAGER_AVAILABLE:
                 self._setup_auto_driver()
             
-            self.automator = WebAutomator(self.config)
+            # Warm DNS for any configured preload_hosts while the driver starts
+            self._preload_hosts()
+            
+            self._pool = BrowserPool.for_config(self.config)
+            self.automator = self._pool.acquire(self.config)
+            self._caps = (
+                (self.CAP_PRESS_KEY if hasattr(self.automator, 'press_key') else 0)
+                | (self.CAP_SCREENSHOT_BYTES if hasattr(self.automator, 'get_screenshot_bytes') else 0)
+                | (self.CAP_DRIVER if hasattr(self.automator, 'driver') else 0)
+                | (self.CAP_PAGE_INFO if hasattr(self.automator, 'get_page_info') else 0)
+            )
             self._initialized = True
             logger.info("Web automator initialized successfully")
             self.session.log_action("initialize", True, "Web automator ready")
@@ -342,9 +542,23 @@ class SafeWebAutomator:
             self.session.log_error(f"Initialization failed: {e}")
             return False
     
+    def _preload_hosts(self):
+        """Start resolving/connecting to preload_hosts in the background"""
+        hosts = self.settings.preload_hosts
+        if not hosts:
+            return
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(hosts), 4), thread_name_prefix="host-preload"
+        )
+        for host in hosts:
+            executor.submit(_preload_host, host)
+        # Don't block initialization on the results
+        executor.shutdown(wait=False)
+    
     def _setup_auto_driver(self):
         """Setup automatic driver management"""
-        browser = self.config.get('browser', 'chrome').lower()
+        browser = self.settings.browser.lower()
         
         try:
             if browser == 'chrome':
@@ -360,11 +574,8 @@ class SafeWebAutomator:
     
     def is_valid_url(self, url: str) -> bool:
         """Validate URL for safety"""
-        try:
-            parsed = urlparse(url)
-            return parsed.scheme in ['http', 'https'] and bool(parsed.netloc)
-        except Exception:
-            return False
+        # Unhashable input would make lru_cache raise before the type check runs
+        return isinstance(url, str) and _validate_url(url)
     
     @measure_performance
     def navigate_to(self, url: str, max_retries: int = None) -> bool:
@@ -379,7 +590,7 @@ class SafeWebAutomator:
             self.session.log_action("navigate", False, f"Invalid URL: {url}")
             return False
         
-        max_retries = max_retries or self.config.get('max_retries', 3)
+        max_retries = max_retries or self.settings.max_retries
         
         for attempt in range(max_retries):
             try:
@@ -390,7 +601,8 @@ class SafeWebAutomator:
                     return True
                 
                 logger.warning(f"Navigation attempt {attempt + 1} failed")
-                time.sleep(1)  # Brief pause before retry
+                # Exponential backoff: 0.1s, 0.2s, 0.4s ... capped
+                time.sleep(min(0.1 * (2 ** attempt), self.settings.retry_backoff_cap))
                 
             except TimeoutException:
                 logger.warning(f"Navigation timeout on attempt {attempt + 1}")
@@ -404,21 +616,14 @@ class SafeWebAutomator:
     
     def _parse_selector(self, selector: str) -> Tuple[str, str]:
         """Parse selector into Selenium By strategy"""
-        if selector.startswith("//"):
-            return (By.XPATH, selector)
-        elif selector.startswith("#"):
-            return (By.ID, selector[1:])
-        elif selector.startswith(".") and " " not in selector:
-            return (By.CLASS_NAME, selector[1:])
-        else:
-            return (By.CSS_SELECTOR, selector)
+        return _compile_selector(selector)
     
     def wait_for_element(self, selector: str, timeout: int = None) -> bool:
         """Wait for element with proper timeout"""
         if not self._initialized or not self.automator:
             return False
         
-        timeout = timeout or self.config.get('wait_timeout', 10)
+        timeout = timeout or self.settings.wait_timeout
         
         try:
             # Wait for element to be visible, then find it
@@ -443,7 +648,7 @@ class SafeWebAutomator:
         if not self._initialized or not self.automator:
             return None
         
-        timeout = timeout or self.config.get('wait_timeout', 10)
+        timeout = timeout or self.settings.wait_timeout
         timeout_per_selector = max(2, timeout // len(selectors))
         
         for selector in selectors:
@@ -465,17 +670,33 @@ class SafeWebAutomator:
         self.session.log_action("wait_advanced", False, f"No selector matched")
         return None
     
+    def wait_for_ready(self, timeout: int = 5, network_idle: bool = False) -> bool:
+        """Wait until the current page reports document.readyState == 'complete'
+        (and, with network_idle, has stopped loading resources)"""
+        if not self._initialized or not self.automator:
+            return False
+        
+        try:
+            return self.automator.wait_for_ready(timeout=timeout, network_idle=network_idle)
+        except Exception as e:
+            logger.debug(f"Page readiness wait failed: {e}")
+            return False
+    
     def wait_for_clickable(self, selector: str, timeout: int = None) -> Optional[Any]:
         """Wait for element to be clickable"""
         if not self._initialized or not self.automator:
             return None
         
-        timeout = timeout or self.config.get('wait_timeout', 10)
+        timeout = timeout or self.settings.wait_timeout
         
         try:
-            if hasattr(self.automator, 'driver'):
+            if self._caps & self.CAP_DRIVER:
                 by, value = self._parse_selector(selector)
-                element = WebDriverWait(self.automator.driver, timeout).until(
+                element = WebDriverWait(
+                    self.automator.driver, timeout,
+                    poll_frequency=self.settings.poll_frequency,
+                    ignored_exceptions=(StaleElementReferenceException,)
+                ).until(
                     EC.element_to_be_clickable((by, value))
                 )
                 self.session.log_action("wait_clickable", True, f"Clickable: {selector}")
@@ -522,6 +743,20 @@ class SafeWebAutomator:
             self.session.log_error(f"Find elements error: {e}")
             return []
     
+    def count_elements(self, selectors: Dict[str, str]) -> Dict[str, int]:
+        """Count matches for several CSS selectors in a single browser round-trip"""
+        if not self._initialized or not self.automator:
+            return {}
+        
+        try:
+            counts = self.automator.count_elements_batch(selectors)
+            self.session.log_action("count_elements", True, f"Counted {len(selectors)} selectors")
+            return counts or {}
+        except Exception as e:
+            logger.error(f"Error counting elements: {e}")
+            self.session.log_error(f"Count elements error: {e}")
+            return {}
+    
     def type_text(self, selector: str, text: str, clear_first: bool = True) -> bool:
         """Type text with proper error handling"""
         if not self._initialized or not self.automator:
@@ -572,22 +807,14 @@ class SafeWebAutomator:
             return False
         
         try:
-            # Check if WebAutomator has press_key method
-            if hasattr(self.automator, 'press_key'):
+            # Use WebAutomator's press_key when it has one (checked once in initialize)
+            if self._caps & self.CAP_PRESS_KEY:
                 success = self.automator.press_key(selector, key)
             else:
                 # Fallback: find element and send keys
                 element = self.automator.find_element(selector)
                 if element and SELENIUM_AVAILABLE:
-                    key_mapping = {
-                        'ENTER': Keys.RETURN,
-                        'RETURN': Keys.RETURN,
-                        'TAB': Keys.TAB,
-                        'ESC': Keys.ESCAPE,
-                        'ESCAPE': Keys.ESCAPE
-                    }
-                    selenium_key = key_mapping.get(key.upper(), key)
-                    element.send_keys(selenium_key)
+                    element.send_keys(_KEY_MAPPING.get(key.upper(), key))
                     success = True
                 else:
                     success = False
@@ -599,24 +826,37 @@ class SafeWebAutomator:
             self.session.log_error(f"Press key error: {e}")
             return False
     
-    def take_screenshot(self, name: str = None) -> Optional[str]:
-        """Take screenshot for debugging"""
+    def take_screenshot(self, name: str = None, image_format: str = "png") -> Optional[str]:
+        """Take screenshot for debugging ("png", or "jpg" for a smaller, faster capture)"""
         if not self._initialized or not self.automator:
             return None
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            
-            if hasattr(self.automator, 'take_screenshot'):
-                self.automator.take_screenshot(filepath)
-            elif hasattr(self.automator, 'driver'):
-                self.automator.driver.save_screenshot(filepath)
+            # Capture synchronously (the page may change next), write in the background
+            if self._caps & self.CAP_SCREENSHOT_BYTES:
+                data = self.automator.get_screenshot_bytes(image_format)
+            elif self._caps & self.CAP_DRIVER:
+                # The raw driver only captures PNG; name the file to match
+                data = self.automator.driver.get_screenshot_as_png()
+                image_format = "png"
             else:
                 return None
             
-            logger.info(f"Screenshot saved: {filepath}")
+            if not data:
+                self.session.log_error("Screenshot error: capture returned no data")
+                return None
+            
+            # Session start stamp + per-session sequence: unique even within one second
+            filename = f"{name or 'screenshot'}_{self._session_stamp}_{next(self._shot_counter)}.{image_format}"
+            filepath = os.path.join(self.screenshots_dir, filename)
+            
+            if self._screenshot_writer is None:
+                self._screenshot_writer = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="screenshot-writer"
+                )
+            self._screenshot_writer.submit(_write_bytes, filepath, data)
+            
+            logger.debug(f"Screenshot queued: {filepath}")
             self.session.log_screenshot(filepath)
             return filepath
             
@@ -631,7 +871,7 @@ class SafeWebAutomator:
             return []
         
         try:
-            if hasattr(self.automator, 'driver'):
+            if self._caps & self.CAP_DRIVER:
                 logs = self.automator.driver.get_log('browser')
                 self.session.log_action("get_console_logs", True, f"Retrieved {len(logs)} log entries")
                 return logs
@@ -645,10 +885,13 @@ class SafeWebAutomator:
             return {}
         
         try:
-            info = {
-                'url': self.automator.get_current_url(),
-                'title': self.automator.get_page_title()
-            }
+            if self._caps & self.CAP_PAGE_INFO:
+                info = self.automator.get_page_info()
+            else:
+                info = {
+                    'url': self.automator.get_current_url(),
+                    'title': self.automator.get_page_title()
+                }
             self.session.log_action("get_page_info", True, f"Got info for {info.get('url')}")
             return info
         except Exception as e:
@@ -656,11 +899,23 @@ class SafeWebAutomator:
             self.session.log_error(f"Page info error: {e}")
             return {}
     
-    def cleanup(self):
-        """Clean up resources"""
+    def cleanup(self, keep_warm: bool = False):
+        """Clean up resources
+        
+        The browser is quit unless keep_warm is set, in which case it is parked
+        in the shared BrowserPool for the next session in this process.
+        """
+        # Make sure every queued screenshot has reached disk
+        if self._screenshot_writer is not None:
+            self._screenshot_writer.shutdown(wait=True)
+            self._screenshot_writer = None
+        
         if self._initialized and self.automator:
             try:
-                self.automator.cleanup()
+                if keep_warm:
+                    self._pool.release(self.automator)
+                else:
+                    self._pool.discard(self.automator)
                 logger.info("Web automator cleaned up successfully")
                 self.session.log_action("cleanup", True, "Resources cleaned up")
             except Exception as e:
@@ -672,8 +927,10 @@ class SafeWebAutomator:
 
 
 @contextmanager
-def automation_session(config: Dict[str, Any], session: AutomationSession = None):
-    """Context manager for safe automation sessions"""
+def automation_session(config: Dict[str, Any], session: AutomationSession = None,
+                       keep_warm: bool = False):
+    """Context manager for safe automation sessions (keep_warm: park the
+    browser for a later session instead of quitting it)"""
     session = session or AutomationSession()
     automator = SafeWebAutomator(config, session)
     
@@ -686,7 +943,7 @@ def automation_session(config: Dict[str, Any], session: AutomationSession = None
         console.print("\n⚠️ Interrupted by user", style="bold yellow")
         raise
     finally:
-        automator.cleanup()
+        automator.cleanup(keep_warm)
 
 
 def confirm_live_automation(auto_confirm: bool = False) -> bool:
@@ -717,11 +974,7 @@ def example_1_basic_navigation(automator: SafeWebAutomator) -> bool:
         url = "https://example.com"
         console.print(f"Navigating to {url}...")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with progress_spinner() as progress:
             task = progress.add_task("Loading page...", total=None)
             success = automator.navigate_to(url)
             progress.remove_task(task)
@@ -739,8 +992,9 @@ def example_1_basic_navigation(automator: SafeWebAutomator) -> bool:
             if console_logs:
                 console.print(f"   Console logs: {len(console_logs)} entries")
             
-            # Give user time to see
-            time.sleep(2)
+            # Give user time to see (demo runs only)
+            if automator.settings.demo_mode:
+                time.sleep(2)
             return True
         else:
             console.print("❌ Navigation failed", style="bold red")
@@ -823,10 +1077,14 @@ def example_2_search_automation(automator: SafeWebAutomator, claude: Optional[An
             "div[data-testid='result']"
         ]
         
-        results_element = automator.wait_for_element_advanced(result_selectors, timeout=10)
+        # One wait on a CSS selector list: the browser matches all candidates
+        # per poll instead of each selector getting its own serial timeout
+        results_loaded = automator.wait_for_element(", ".join(result_selectors), timeout=10)
         
-        if results_element:
-            console.print(f"✅ Search results loaded")
+        if results_loaded:
+            counts = automator.count_elements({s: s for s in result_selectors})
+            matched = next((s for s in result_selectors if counts.get(s)), "unknown selector")
+            console.print(f"✅ Search results loaded (matched {matched})")
         else:
             console.print("⚠️ Could not verify search results", style="yellow")
             automator.take_screenshot("search_results_timeout")
@@ -835,7 +1093,8 @@ def example_2_search_automation(automator: SafeWebAutomator, claude: Optional[An
         page_info = automator.get_page_info()
         console.print(f"   Results URL: {page_info.get('url', 'Unknown')}")
         
-        time.sleep(2)
+        if automator.settings.demo_mode:
+            time.sleep(2)
         return True
         
     except Exception as e:
@@ -862,28 +1121,18 @@ def example_3_element_detection(automator: SafeWebAutomator) -> bool:
             ("Input Fields", "input", "Input elements")
         ]
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Detecting elements...", total=len(element_types))
+        # All counts in one round-trip instead of a find_elements per type
+        counts = automator.count_elements(
+            {name: selector for name, selector, _ in element_types}
+        )
+        
+        elements_found = []
+        for name, selector, description in element_types:
+            count = counts.get(name, 0)
+            elements_found.append((name, count, description))
             
-            elements_found = []
-            for name, selector, description in element_types:
-                try:
-                    elements = automator.find_elements(selector)
-                    count = len(elements)
-                    elements_found.append((name, count, description))
-                    
-                    if count > 0:
-                        logger.info(f"Found {count} {name.lower()}")
-                except Exception as e:
-                    logger.warning(f"Error finding {name}: {e}")
-                    elements_found.append((name, 0, description))
-                
-                progress.advance(task)
+            if count > 0:
+                logger.info(f"Found {count} {name.lower()}")
         
         # Display results
         console.print("\n📋 Element Detection Results:")
@@ -894,7 +1143,8 @@ def example_3_element_detection(automator: SafeWebAutomator) -> bool:
         # Take screenshot of analyzed page
         automator.take_screenshot("element_analysis")
         
-        time.sleep(3)
+        if automator.settings.demo_mode:
+            time.sleep(3)
         return True
         
     except Exception as e:
@@ -903,7 +1153,57 @@ def example_3_element_detection(automator: SafeWebAutomator) -> bool:
         return False
 
 
-def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
+def create_claude_client(config: Dict[str, Any]) -> Tuple[Optional[Any], str]:
+    """Create a Claude client if an API key is configured; returns (client, status message)"""
+    api_key = os.getenv('ANTHROPIC_API_KEY')
+    if not api_key or api_key == 'your-claude-api-key-here':
+        return None, "⚠️ No Claude API key - running without AI guidance"
+    
+    try:
+        return ClaudeClient(api_key=api_key, config=config), "✅ Claude 3.5 guidance active"
+    except Exception as e:
+        logger.warning(f"Claude initialization failed: {e}")
+        return None, "⚠️ Continuing without Claude guidance"
+
+
+# Page example 3 analyzes when it runs on its own (in the serial flow it
+# inspects the results page example 2 leaves behind)
+EXAMPLE_3_URL = "https://duckduckgo.com/?q=Python+web+automation+selenium"
+
+
+def _run_example(job: Tuple[int, Dict[str, Any]]) -> Tuple[bool, AutomationSession]:
+    """Run one example in its own browser session (pool worker entry point)"""
+    number, config = job
+    session = AutomationSession()
+    
+    # cleanup() quits the browser: atexit doesn't run in workers, so nothing may stay parked
+    try:
+        with automation_session(config, session) as automator:
+            if not automator:
+                return False, session
+            
+            if number == 1:
+                success = example_1_basic_navigation(automator)
+            elif number == 2:
+                claude, _ = create_claude_client(config)
+                success = example_2_search_automation(automator, claude)
+            else:
+                success = (
+                    automator.navigate_to(EXAMPLE_3_URL)
+                    and example_3_element_detection(automator)
+                )
+    except Exception as e:
+        # Report the failure as this example's outcome; letting it escape would
+        # make pool.map re-raise it and lose every other example's result
+        logger.error(f"Example {number} failed: {e}")
+        session.log_error(f"Example {number} error: {e}")
+        return False, session
+    
+    return success, session
+
+
+def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False,
+                        parallel: bool = False):
     """Run complete live automation workflow"""
     console.print(Panel.fit(
         "🌐 Live Web Automation with Claude 3.5\nEnhanced Edition v3.0",
@@ -911,6 +1211,7 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
     ))
     
     # Check dependencies
+    load_automation_stack()
     if not IMPORTS_AVAILABLE:
         console.print("❌ Required modules not available", style="bold red")
         console.print("Install with: pip install -r requirements.txt")
@@ -925,19 +1226,6 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
     if not confirm_live_automation(skip_confirm):
         return
     
-    # Initialize Claude if available
-    claude = None
-    api_key = os.getenv('ANTHROPIC_API_KEY')
-    if api_key and api_key != 'your-claude-api-key-here':
-        try:
-            claude = ClaudeClient(api_key=api_key, config=config)
-            console.print("✅ Claude 3.5 guidance active\n")
-        except Exception as e:
-            logger.warning(f"Claude initialization failed: {e}")
-            console.print("⚠️ Continuing without Claude guidance\n")
-    else:
-        console.print("⚠️ No Claude API key - running without AI guidance\n")
-    
     # Create automation session
     session = AutomationSession()
     
@@ -948,10 +1236,36 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
         'example_3': False
     }
     
+    processes = min(len(results), config.get('max_parallel_sessions', 1))
+    if parallel and processes > 1:
+        # Independent examples, one browser per worker process: wall-clock is
+        # the slowest example rather than the sum of all three
+        console.print(f"⚡ Running {len(results)} examples across {processes} browser sessions\n")
+        with multiprocessing.Pool(processes=processes) as pool:
+            outcomes = pool.map(_run_example, [(n, config) for n in (1, 2, 3)])
+        
+        for n, (success, worker_session) in enumerate(outcomes, start=1):
+            results[f'example_{n}'] = success
+            session.merge(worker_session)
+        console.print()
+    elif not _run_examples_serially(config, session, results):
+        return
+    
+    _display_run_summary(session, results)
+
+
+def _run_examples_serially(config: Dict[str, Any], session: AutomationSession,
+                           results: Dict[str, bool]) -> bool:
+    """Run the three examples one after another in a single browser session
+    (returns False if the automator could not be initialized)"""
+    # Initialize Claude if available
+    claude, claude_status = create_claude_client(config)
+    console.print(claude_status + "\n")
+    
     with automation_session(config, session) as automator:
         if not automator:
             console.print("❌ Failed to initialize automation", style="bold red")
-            return
+            return False
         
         console.print("✅ Web automator initialized\n")
         console.print("="*60 + "\n")
@@ -968,6 +1282,11 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
         results['example_3'] = example_3_element_detection(automator)
         console.print()
     
+    return True
+
+
+def _display_run_summary(session: AutomationSession, results: Dict[str, bool]):
+    """Display session metrics and the per-example outcome panel"""
     # Summary
     console.print("="*60 + "\n")
     
@@ -994,6 +1313,7 @@ def run_live_automation(config: Dict[str, Any], skip_confirm: bool = False):
 def health_check(config: Dict[str, Any]) -> bool:
     """Run a quick health check of the automation system"""
     console.print(Panel.fit("🏥 Running System Health Check", style="bold cyan"))
+    load_automation_stack()
     
     checks = {
         'Python version': sys.version_info >= (3, 7),
@@ -1025,6 +1345,71 @@ def health_check(config: Dict[str, Any]) -> bool:
     return all_passed
 
 
+# Feature overview shown by show_capabilities, as (category, features) pairs
+_CAPABILITIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("🧭 Navigation", (
+        "URL validation before navigation",
+        "Automatic retry logic for failed loads",
+        "Back/forward browser history control",
+        "Multi-tab and window management",
+        "Configurable page load timeouts",
+        "Page visit tracking and analytics",
+    )),
+    ("🎯 Element Interaction", (
+        "Smart element waiting (no hardcoded sleeps)",
+        "Stale element retry handling",
+        "CSS selector and XPath support",
+        "Safe text input with validation",
+        "Key press abstraction (ENTER, TAB, etc.)",
+        "Multiple selector fallback strategies",
+        "Wait for clickable elements",
+    )),
+    ("🔍 Search & Data", (
+        "Automated search engine interaction",
+        "Multiple selector fallback strategies",
+        "Result verification and validation",
+        "Data extraction with error handling",
+        "Context-aware element detection",
+        "Advanced element finding with retries",
+    )),
+    ("🧠 AI Integration", (
+        "Claude 3.5 task planning and guidance",
+        "Intelligent workflow generation",
+        "Context-aware decision making",
+        "Graceful fallback without AI",
+        "Error recovery with AI assistance",
+    )),
+    ("⚡ Advanced Features", (
+        "Automatic screenshot on errors",
+        "Comprehensive logging and debugging",
+        "Configuration validation",
+        "Resource cleanup guarantees",
+        "Context manager for safe sessions",
+        "Performance measurement decorators",
+        "Session state tracking and metrics",
+        "Browser console log capture",
+        "Automatic driver management",
+    )),
+    ("🛡️ Safety & Security", (
+        "URL validation before navigation",
+        "Proper exception handling hierarchy",
+        "KeyboardInterrupt preservation",
+        "Resource leak prevention",
+        "User confirmation for live actions",
+        "Comprehensive error logging",
+    )),
+    ("📊 Monitoring & Analytics", (
+        "Action tracking and logging",
+        "Error tracking and reporting",
+        "Screenshot management",
+        "Page visit history",
+        "Success rate calculations",
+        "Session duration tracking",
+        "Performance metrics",
+    )),
+)
+
+
 def show_capabilities():
     """Display automation capabilities without running"""
     console.print(Panel.fit(
@@ -1032,70 +1417,7 @@ def show_capabilities():
         style="bold blue"
     ))
     
-    capabilities = {
-        "🧭 Navigation": [
-            "URL validation before navigation",
-            "Automatic retry logic for failed loads",
-            "Back/forward browser history control",
-            "Multi-tab and window management",
-            "Configurable page load timeouts",
-            "Page visit tracking and analytics"
-        ],
-        "🎯 Element Interaction": [
-            "Smart element waiting (no hardcoded sleeps)",
-            "Stale element retry handling",
-            "CSS selector and XPath support",
-            "Safe text input with validation",
-            "Key press abstraction (ENTER, TAB, etc.)",
-            "Multiple selector fallback strategies",
-            "Wait for clickable elements"
-        ],
-        "🔍 Search & Data": [
-            "Automated search engine interaction",
-            "Multiple selector fallback strategies",
-            "Result verification and validation",
-            "Data extraction with error handling",
-            "Context-aware element detection",
-            "Advanced element finding with retries"
-        ],
-        "🧠 AI Integration": [
-            "Claude 3.5 task planning and guidance",
-            "Intelligent workflow generation",
-            "Context-aware decision making",
-            "Graceful fallback without AI",
-            "Error recovery with AI assistance"
-        ],
-        "⚡ Advanced Features": [
-            "Automatic screenshot on errors",
-            "Comprehensive logging and debugging",
-            "Configuration validation",
-            "Resource cleanup guarantees",
-            "Context manager for safe sessions",
-            "Performance measurement decorators",
-            "Session state tracking and metrics",
-            "Browser console log capture",
-            "Automatic driver management"
-        ],
-        "🛡️ Safety & Security": [
-            "URL validation before navigation",
-            "Proper exception handling hierarchy",
-            "KeyboardInterrupt preservation",
-            "Resource leak prevention",
-            "User confirmation for live actions",
-            "Comprehensive error logging"
-        ],
-        "📊 Monitoring & Analytics": [
-            "Action tracking and logging",
-            "Error tracking and reporting",
-            "Screenshot management",
-            "Page visit history",
-            "Success rate calculations",
-            "Session duration tracking",
-            "Performance metrics"
-        ]
-    }
-    
-    for category, features in capabilities.items():
+    for category, features in _CAPABILITIES:
         console.print(f"\n{category}")
         for feature in features:
             console.print(f"   ✅ {feature}")
@@ -1141,6 +1463,11 @@ def main():
         action='store_true',
         help='Run browser in headless mode'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run the live examples concurrently, one browser per example'
+    )
     parser.add_argument(
         '--yes', '-y',
         action='store_true',
@@ -1174,7 +1501,7 @@ def main():
         
         # Run appropriate mode
         if args.live:
-            run_live_automation(config, skip_confirm=args.yes)
+            run_live_automation(config, skip_confirm=args.yes, parallel=args.parallel)
         else:
             show_capabilities()
             console.print("\n💡 Add --live flag to run actual browser automation")
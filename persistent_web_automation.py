@@ -259,13 +259,12 @@ class WebAutomationShell(cmd.Cmd):
             title = driver.title
             url = driver.current_url
             
-            # Count elements
-            links = len(driver.find_elements('tag name', 'a'))
-            buttons = len(driver.find_elements('tag name', 'button'))
-            inputs = len(driver.find_elements('tag name', 'input'))
-            forms = len(driver.find_elements('tag name', 'form'))
-            headings = len(driver.find_elements('css selector', 'h1,h2,h3,h4,h5,h6'))
-            images = len(driver.find_elements('tag name', 'img'))
+            # Count elements in one script - only the counts cross the wire,
+            # not a WebElement reference per match
+            links, buttons, inputs, forms, headings, images = driver.execute_script(
+                "return arguments[0].map(s => document.querySelectorAll(s).length);",
+                ['a', 'button', 'input', 'form', 'h1,h2,h3,h4,h5,h6', 'img']
+            )
             
             # Create analysis table
             table = Table(title="📋 Page Analysis Results")
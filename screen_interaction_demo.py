@@ -107,11 +107,11 @@ def demo_vision_analysis(screenshot=None):
                 
                 # Convert screenshot to bytes for analysis
                 import cv2
-                _, img_bytes = cv2.imencode('.png', screenshot)
+                _, img_buffer = cv2.imencode('.png', screenshot)
                 
-                # Analyze with Claude 3.5
+                # Analyze with Claude 3.5 (the encoded buffer is passed as-is)
                 analysis_result = claude.analyze_screenshot(
-                    img_bytes.tobytes(),
+                    img_buffer,
                     "Analyze this desktop screenshot and identify interactive elements"
                 )
                 progress.remove_task(task)
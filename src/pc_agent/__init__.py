@@ -6,6 +6,7 @@ A computer-using agent that can interact with computer interfaces and perform au
 from .computer_agent import ComputerAgent
 from .vision_analyzer import VisionAnalyzer
 from .web_automator import WebAutomator
+from .browser_pool import BrowserPool
 from .task_executor import TaskExecutor
 from .claude_client import ClaudeClient
 
@@ -14,6 +15,7 @@ __all__ = [
     "ComputerAgent",
     "VisionAnalyzer", 
     "WebAutomator",
+    "BrowserPool",
     "TaskExecutor",
     "ClaudeClient"
 ]
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Browser Pool - Warm WebAutomator instances shared across automation sessions
+"""
+
+import os
+import time
+import queue
+import atexit
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from loguru import logger
+
+from .web_automator import WebAutomator
+
+
+class BrowserPool:
+    """
+    Pool of warm WebAutomator instances, one pool per (browser, headless) mode
+
+    acquire() hands out an idle browser of the pool's own mode or starts a new
+    one; at most pool_max_size are checked out at once. release() resets a
+    browser (cookies and storage cleared, about:blank) and parks it for the
+    next session, while discard() closes it. A background timer evicts
+    browsers idle past pool_idle_timeout (keeping pool_min_size) and drops any
+    whose driver no longer responds. Parked browsers are closed at interpreter
+    exit; multiprocessing workers, where atexit doesn't run, must call
+    drain_all() themselves.
+    """
+
+    # Used for any pool_* key missing from the config
+    DEFAULTS = {
+        'pool_min_size': int(os.getenv('AUTOMATION_POOL_MIN_SIZE', '0')),
+        'pool_max_size': int(os.getenv('AUTOMATION_POOL_MAX_SIZE', '2')),
+        'pool_idle_timeout': float(os.getenv('AUTOMATION_POOL_IDLE_TIMEOUT', '300')),
+        'pool_acquire_timeout': float(os.getenv('AUTOMATION_POOL_ACQUIRE_TIMEOUT', '30')),
+        'pool_health_check_interval': float(os.getenv('AUTOMATION_POOL_HEALTH_CHECK_INTERVAL', '60')),
+    }
+
+    _pools: Dict[Tuple[str, bool], 'BrowserPool'] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, config: Dict[str, Any]):
+        settings = {key: config.get(key, default) for key, default in self.DEFAULTS.items()}
+        self.config = config
+        self.min_size = settings['pool_min_size']
+        self.max_size = max(1, settings['pool_max_size'])
+        self.idle_timeout = settings['pool_idle_timeout']
+        self.acquire_timeout = settings['pool_acquire_timeout']
+        self.health_check_interval = settings['pool_health_check_interval']
+
+        self._idle = queue.LifoQueue()  # (automator, released_at); LIFO keeps the warmest on top
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._timer = None
+        self._timer_lock = threading.Lock()
+
+    @classmethod
+    def for_config(cls, config: Dict[str, Any]) -> 'BrowserPool':
+        """Get the shared pool for this config's browser/headless combination"""
+        key = (config.get('browser', 'chrome').lower(), bool(config.get('headless', False)))
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls._pools[key] = cls(config)
+                atexit.register(pool.drain)
+            return pool
+
+    @classmethod
+    def drain_all(cls):
+        """Close the idle browsers of every pool in this process"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        for pool in pools:
+            pool.drain()
+
+    def acquire(self, config: Optional[Dict[str, Any]] = None) -> WebAutomator:
+        """Check out a healthy automator, creating one from config (default:
+        the pool's own) if none are idle"""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No browser available within {self.acquire_timeout}s")
+
+        try:
+            while True:
+                try:
+                    automator, _ = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_healthy(automator):
+                    logger.debug("Reusing pooled browser")
+                    return automator
+                self._close(automator)
+
+            return WebAutomator(config or self.config)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, automator: WebAutomator):
+        """Reset an automator and return it to the pool (closing it if the reset fails)"""
+        try:
+            driver = automator.driver
+            if driver is not None:
+                driver.delete_all_cookies()
+                # Storage access throws on opaque origins (about:, data:); nothing to clear there
+                driver.execute_script(
+                    "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+                )
+                driver.get("about:blank")
+                # Undo any implicit wait a caller set on the raw driver so the next
+                # session's explicit waits aren't multiplied by it
+                driver.implicitly_wait(0)
+            self._idle.put((automator, time.monotonic()))
+            self._schedule_health_check()
+        except Exception as e:
+            logger.debug(f"Discarding browser that failed to reset: {e}")
+            self._close(automator)
+        finally:
+            self._slots.release()
+
+    def discard(self, automator: WebAutomator):
+        """Close a checked-out automator instead of returning it to the pool"""
+        try:
+            self._close(automator)
+        finally:
+            self._slots.release()
+
+    def drain(self):
+        """Close every idle browser and stop the health-check timer"""
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+        while True:
+            try:
+                automator, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close(automator)
+
+    @staticmethod
+    def _is_healthy(automator: WebAutomator) -> bool:
+        """Cheap liveness probe; an automator that never started a driver is fine"""
+        if automator.driver is None:
+            return True
+        try:
+            automator.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(automator: WebAutomator):
+        try:
+            automator.cleanup()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser: {e}")
+
+    def _schedule_health_check(self):
+        with self._timer_lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.health_check_interval, self._health_check)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _health_check(self):
+        """Evict idle-expired and crashed browsers, then re-arm while any remain"""
+        with self._timer_lock:
+            self._timer = None
+
+        now = time.monotonic()
+        keep = []
+        while True:
+            try:
+                automator, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            expired = now - released_at > self.idle_timeout and len(keep) >= self.min_size
+            if expired or not self._is_healthy(automator):
+                self._close(automator)
+            else:
+                keep.append((automator, released_at))
+
+        # Oldest first so the LIFO order (warmest on top) is preserved
+        for item in reversed(keep):
+            self._idle.put(item)
+        if keep:
+            self._schedule_health_check()
@@ -8,7 +8,8 @@ import anthropic
 import json
 import base64
 import os
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from loguru import logger
 
 try:
@@ -18,6 +19,46 @@ except ImportError:
     pass  # dotenv is optional
 
 
+def _detect_media_type(image_data: bytes) -> str:
+    """Detect the image media type from its magic bytes (defaults to PNG)"""
+    header = bytes(image_data[:12])
+    if header.startswith(b'\xff\xd8\xff'):
+        return "image/jpeg"
+    if header.startswith(b'GIF8'):
+        return "image/gif"
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/png"
+
+
+def _image_block(image_data: bytes) -> Dict[str, Any]:
+    """Build a base64 image content block straight from encoded image bytes"""
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": _detect_media_type(image_data),
+            "data": base64.b64encode(image_data).decode('ascii')
+        }
+    }
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _shared_http_client():
+    """One keep-alive connection pool shared by every ClaudeClient in the process"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx
+            _http_client = anthropic.DefaultHttpxClient(
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            )
+        return _http_client
+
+
 class ClaudeClient:
     """Client for interacting with Claude API"""
     
@@ -37,32 +78,21 @@ class ClaudeClient:
         
         if self.api_key and self.api_key != 'your-claude-api-key-here':
             try:
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                # Share TCP/TLS connections with the process's other Claude clients
+                self.client = anthropic.Anthropic(
+                    api_key=self.api_key,
+                    http_client=_shared_http_client()
+                )
                 logger.info(f"Claude client initialized successfully with model: {self.model}")
             except Exception as e:
                 logger.error(f"Failed to initialize Claude client: {e}")
         else:
             logger.warning("No API key provided for Claude client")
 
-    def analyze_screenshot(self, image_data: bytes, task_description: str = "") -> Dict[str, Any]:
-        """
-        Analyze screenshot using Claude's vision capabilities
-        
-        Args:
-            image_data: Screenshot image data
-            task_description: Optional task context
-            
-        Returns:
-            Analysis results from Claude
-        """
-        if not self.client:
-            return {"error": "Claude client not initialized"}
-            
-        try:
-            # Encode image to base64
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            prompt = f"""Analyze this screenshot and identify interactive elements.
+    def _screenshot_messages(self, image_data: bytes, task_description: str) -> List[Dict[str, Any]]:
+        """Build the vision request messages shared by the screenshot analyzers"""
+        # current_state comes first so streaming callers can show it early
+        prompt = f"""Analyze this screenshot and identify interactive elements.
             
             Task context: {task_description}
             
@@ -76,6 +106,7 @@ class ClaudeClient:
             
             Return your analysis in JSON format with the following structure:
             {{
+                "current_state": "description of current screen state",
                 "elements": [
                     {{
                         "type": "button|link|input|form",
@@ -84,34 +115,45 @@ class ClaudeClient:
                         "location": "approximate location description"
                     }}
                 ],
-                "current_state": "description of current screen state",
                 "recommended_actions": ["list of suggested next steps"],
                 "confidence": 0.8
             }}"""
+        
+        return [
+            {
+                "role": "user",
+                "content": [
+                    _image_block(image_data),
+                    {
+                        "type": "text",
+                        "text": prompt
+                    }
+                ]
+            }
+        ]
+
+    def analyze_screenshot(self, image_data: bytes, task_description: str = "") -> Dict[str, Any]:
+        """
+        Analyze screenshot using Claude's vision capabilities
+        
+        Args:
+            image_data: Screenshot image data (PNG, JPEG, GIF or WebP); any
+                        bytes-like object works, e.g. the buffer returned by
+                        cv2.imencode, so no intermediate bytes copy is needed
+            task_description: Optional task context
+            
+        Returns:
+            Analysis results from Claude
+        """
+        if not self.client:
+            return {"error": "Claude client not initialized"}
             
+        try:
             message = self.client.messages.create(
                 model=self.vision_model,
                 max_tokens=min(self.max_tokens, 4096),
                 temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_base64
-                                }
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ]
+                messages=self._screenshot_messages(image_data, task_description)
             )
             
             response_text = message.content[0].text
@@ -131,6 +173,117 @@ class ClaudeClient:
             logger.error(f"Failed to analyze screenshot with Claude: {e}")
             return {"error": str(e)}
 
+    def analyze_screenshot_stream(self, image_data: bytes, task_description: str = "") -> Iterator[str]:
+        """
+        Stream Claude's screenshot analysis as it is generated
+        
+        Args:
+            image_data: Screenshot image data (PNG, JPEG, GIF or WebP)
+            task_description: Optional task context
+            
+        Yields:
+            Text chunks of the JSON analysis (same structure as analyze_screenshot)
+        """
+        if not self.client:
+            raise RuntimeError("Claude client not initialized")
+            
+        with self.client.messages.stream(
+            model=self.vision_model,
+            max_tokens=min(self.max_tokens, 4096),
+            temperature=self.temperature,
+            messages=self._screenshot_messages(image_data, task_description)
+        ) as stream:
+            yield from stream.text_stream
+
+    def analyze_screenshots_batch(self, screenshots: List[Tuple[bytes, str]]) -> Dict[str, Any]:
+        """
+        Analyze several screenshots in a single Claude request
+        
+        Args:
+            screenshots: List of (image_data, task_description) tuples
+            
+        Returns:
+            Dictionary with a "screenshots" list holding one analysis per
+            image, in the same order and with the same structure as
+            analyze_screenshot results
+        """
+        if not self.client:
+            return {"error": "Claude client not initialized"}
+            
+        if not screenshots:
+            return {"screenshots": []}
+            
+        try:
+            # Pack every image into one multi-image user turn
+            content = []
+            for index, (image_data, task_description) in enumerate(screenshots, 1):
+                content.append({
+                    "type": "text",
+                    "text": f"Screenshot {index} - task context: {task_description}"
+                })
+                content.append(_image_block(image_data))
+            
+            content.append({
+                "type": "text",
+                "text": f"""Analyze each of the {len(screenshots)} screenshots above and identify interactive elements.
+
+For each screenshot identify clickable buttons, text input fields, links,
+forms, the current state of the interface and recommended next actions.
+
+Return your analysis in JSON format with one entry per screenshot, in order:
+{{
+    "screenshots": [
+        {{
+            "index": 1,
+            "elements": [
+                {{
+                    "type": "button|link|input|form",
+                    "text": "visible text",
+                    "purpose": "what this element does",
+                    "location": "approximate location description"
+                }}
+            ],
+            "current_state": "description of current screen state",
+            "recommended_actions": ["list of suggested next steps"],
+            "confidence": 0.8
+        }}
+    ]
+}}"""
+            })
+            
+            message = self.client.messages.create(
+                model=self.vision_model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": content
+                    }
+                ]
+            )
+            
+            response_text = message.content[0].text
+            
+            try:
+                # Remove markdown code blocks if present
+                if response_text.strip().startswith('```'):
+                    lines = response_text.strip().split('\n')
+                    json_text = '\n'.join(lines[1:-1])
+                else:
+                    json_text = response_text
+                    
+                return json.loads(json_text)
+            except json.JSONDecodeError:
+                return {
+                    "raw_response": response_text,
+                    "error": "Could not parse JSON response"
+                }
+                
+        except Exception as e:
+            logger.error(f"Failed to analyze screenshot batch with Claude: {e}")
+            return {"error": str(e)}
+
     def plan_task(self, task_description: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Create a task execution plan using Claude
@@ -5,7 +5,7 @@ Computer Agent - Main class for computer interaction and automation
 import os
 import time
 import json
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -50,6 +50,7 @@ class ComputerAgent:
         """Initialize the Computer Agent"""
         self.config = self._load_config(config_path)
         self.setup_logging()
+        self._screen_info = None
         
         # Initialize components
         self.vision_analyzer = VisionAnalyzer(self.config)
@@ -100,16 +101,22 @@ class ComputerAgent:
     # Screen Interaction Methods
     # ===================
     
-    def capture_screen(self, region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+    def capture_screen(self, region: Optional[Tuple[int, int, int, int]] = None,
+                       encoded: str = "raw") -> Union[np.ndarray, bytes]:
         """
         Capture screenshot of the screen or specified region
         
         Args:
             region: (left, top, width, height) tuple for partial capture
+            encoded: 'raw' for an RGB numpy array, or 'jpeg' / 'png' for
+                     image bytes already resized for Claude
             
         Returns:
-            Screenshot as numpy array
+            Screenshot as RGB numpy array, or encoded image bytes
         """
+        if encoded not in ("raw", "jpeg", "png"):
+            raise ValueError(f"Unsupported encoding: {encoded}")
+            
         try:
             if region:
                 screenshot = pyautogui.screenshot(region=region)
@@ -129,6 +136,9 @@ class ComputerAgent:
                 screenshot.save(screenshot_path)
                 logger.debug(f"Screenshot saved: {screenshot_path}")
             
+            if encoded != "raw":
+                return self.vision_analyzer.encode_for_claude(screenshot_np, image_format=encoded)
+                
             return screenshot_np
             
         except Exception as e:
@@ -402,29 +412,55 @@ class ComputerAgent:
         """
         return self.web_automator.navigate_to(url)
 
-    def analyze_screen(self) -> Dict[str, Any]:
+    def initialize_web_automator(self) -> bool:
+        """
+        Create the web automator if needed and start its WebDriver
+        
+        Returns:
+            True if a WebDriver is ready
+        """
+        if self.web_automator is None:
+            self.web_automator = WebAutomator(self.config)
+            self.task_executor.web_automator = self.web_automator
+            
+        return self.web_automator._setup_driver() is not None
+
+    def analyze_screen(self, image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Analyze current screen content using computer vision
         
+        Args:
+            image: Pre-captured screenshot to analyze (captures a new one if None)
+            
         Returns:
             Analysis results dictionary
         """
-        screenshot = self.capture_screen()
+        screenshot = image if image is not None else self.capture_screen()
         return self.vision_analyzer.analyze_image(screenshot)
 
-    def get_screen_info(self) -> Dict[str, Any]:
+    def get_screen_info(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get information about available screens
         
+        The monitor layout is queried once and cached; pass refresh=True
+        after displays are added, removed or rearranged.
+        
+        Args:
+            refresh: Re-query the monitors instead of using the cached result
+            
         Returns:
             Dictionary with screen information
         """
+        if self._screen_info is not None and not refresh:
+            return self._screen_info
+            
         try:
             monitors = screeninfo.get_monitors()
+            size = pyautogui.size()
             screen_info = {
                 'primary': {
-                    'width': pyautogui.size().width,
-                    'height': pyautogui.size().height
+                    'width': size.width,
+                    'height': size.height
                 },
                 'monitors': []
             }
@@ -438,6 +474,7 @@ class ComputerAgent:
                     'is_primary': monitor.is_primary
                 })
                 
+            self._screen_info = screen_info
             return screen_info
             
         except Exception as e:
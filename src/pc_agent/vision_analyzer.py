@@ -10,6 +10,28 @@ from PIL import Image
 from loguru import logger
 
 
+# Largest (width, height) per aspect ratio that Claude accepts without
+# resizing (~1.15 megapixels, ~1600 tokens). Anything larger is resized
+# server-side, costing upload time and latency for no quality gain.
+CLAUDE_IMAGE_SIZES = (
+    (1092, 1092),  # 1:1
+    (951, 1268),   # 3:4
+    (1268, 951),   # 4:3
+    (896, 1344),   # 2:3
+    (1344, 896),   # 3:2
+    (819, 1456),   # 9:16
+    (1456, 819),   # 16:9
+    (784, 1568),   # 1:2
+    (1568, 784),   # 2:1
+)
+
+
+def _snap_to_claude_tile(width: int, height: int) -> Tuple[int, int]:
+    """Pick the Claude image size whose aspect ratio is closest to width/height"""
+    aspect = width / height
+    return min(CLAUDE_IMAGE_SIZES, key=lambda size: abs(size[0] / size[1] - aspect))
+
+
 class VisionAnalyzer:
     """Computer vision analyzer for screen content and UI element detection"""
     
@@ -359,4 +381,64 @@ class VisionAnalyzer:
             
         except Exception as e:
             logger.error(f"Failed to compare images: {e}")
-            return 0.0
\ No newline at end of file
+            return 0.0
+
+    def prepare_for_claude(self, image: np.ndarray) -> np.ndarray:
+        """
+        Downscale an image to fit the Claude size table entry matching its
+        aspect ratio, keeping the image's own aspect ratio
+        
+        Args:
+            image: Image as numpy array (left untouched for local analysis)
+            
+        Returns:
+            Image scaled to fit inside the snapped size, or the original if it
+            already fits without server-side resizing
+        """
+        h, w = image.shape[:2]
+        tile_w, tile_h = _snap_to_claude_tile(w, h)
+        
+        scale = min(tile_w / w, tile_h / h, 1.0)
+        if scale == 1.0:
+            return image
+        
+        target_w = max(1, min(tile_w, round(w * scale)))
+        target_h = max(1, min(tile_h, round(h * scale)))
+        return cv2.resize(image, (target_w, target_h), interpolation=cv2.INTER_AREA)
+
+    def encode_for_claude(self, image: np.ndarray, quality: int = 85,
+                          image_format: str = "jpeg") -> bytes:
+        """
+        Downscale and encode an RGB screenshot for Claude in one pass
+        
+        The resize, colour conversion and encode all run inside OpenCV's C++
+        code with the GIL released, so this is safe to call from worker
+        threads to overlap encoding with other work.
+        
+        Args:
+            image: RGB image as numpy array (as returned by capture_screen)
+            quality: JPEG quality
+            image_format: 'jpeg' or 'png'
+            
+        Returns:
+            Image bytes ready for ClaudeClient.analyze_screenshot
+        """
+        if image_format == "jpeg":
+            extension, params = '.jpg', [cv2.IMWRITE_JPEG_QUALITY, quality]
+        elif image_format == "png":
+            extension, params = '.png', []
+        else:
+            raise ValueError(f"Unsupported image format: {image_format}")
+            
+        claude_image = self.prepare_for_claude(image)
+        
+        # OpenCV encodes BGR; converting after the downscale keeps the copy small
+        ok, buffer = cv2.imencode(
+            extension,
+            cv2.cvtColor(claude_image, cv2.COLOR_RGB2BGR),
+            params
+        )
+        if not ok:
+            raise ValueError(f"Failed to encode image as {image_format.upper()}")
+            
+        return buffer.tobytes()
@@ -9,7 +9,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException
+)
 
 # Auto webdriver management
 try:
@@ -21,11 +23,126 @@ try:
 except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
 
+import os
+import re
+import json
 import time
+import base64
+import shutil
+import subprocess
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import quote_plus
 from loguru import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Resolved driver paths, so webdriver-manager's online version check runs at
+# most once a day per browser version
+DRIVER_CACHE_PATH = Path.home() / ".cache" / "pc_agent" / "driver_paths.json"
+DRIVER_CACHE_TTL = 86400
+
+_BROWSER_BINARIES = {
+    "chrome": (
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ),
+    "firefox": (
+        "firefox",
+        "/Applications/Firefox.app/Contents/MacOS/firefox",
+    ),
+}
+
+
+def _browser_major_version(browser: str, versions: Dict[str, Any]) -> str:
+    """
+    Best-effort major version of the installed browser ("unknown" if not found)
+    
+    versions maps a browser binary path to {"mtime", "major"}; the binary is
+    only run with --version when it is missing there or has changed since, and
+    the result is stored back into versions.
+    """
+    for candidate in _BROWSER_BINARIES.get(browser, ()):
+        binary = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if not binary:
+            continue
+        try:
+            mtime = os.stat(binary).st_mtime
+        except OSError:
+            continue
+        
+        cached = versions.get(binary)
+        if isinstance(cached, dict) and cached.get("mtime") == mtime and cached.get("major"):
+            return cached["major"]
+        
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=5
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.", output)
+        if match:
+            versions[binary] = {"mtime": mtime, "major": match.group(1)}
+            return match.group(1)
+    return "unknown"
+
+
+def install_driver(browser: str) -> str:
+    """
+    Return a driver executable path for chrome/firefox, asking webdriver-manager
+    only when there is no fresh cached path for the installed browser version
+    
+    A file lock keeps parallel sessions from all hitting the network at once.
+    Malformed cache entries are treated as misses.
+    """
+    browser = browser.lower()
+    DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(DRIVER_CACHE_PATH.with_suffix(".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        
+        try:
+            cache = json.loads(DRIVER_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        
+        # Browser versions live beside the "<browser>:<major>" driver entries
+        versions = cache.get("versions")
+        if not isinstance(versions, dict):
+            versions = cache["versions"] = {}
+        known_versions = dict(versions)
+        key = f"{browser}:{_browser_major_version(browser, versions)}"
+        
+        entry = cache.get(key)
+        if (isinstance(entry, dict)
+                and time.time() - entry.get("timestamp", 0) < DRIVER_CACHE_TTL
+                and isinstance(entry.get("path"), str) and os.path.exists(entry["path"])):
+            if versions != known_versions:
+                _save_driver_cache(cache)
+            return entry["path"]
+        
+        manager = ChromeDriverManager() if browser == "chrome" else GeckoDriverManager()
+        path = manager.install()
+        cache[key] = {"path": path, "timestamp": time.time()}
+        _save_driver_cache(cache)
+        return path
+
+
+def _save_driver_cache(cache: Dict[str, Any]):
+    """Write the driver cache back, ignoring an unwritable cache directory"""
+    try:
+        DRIVER_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug(f"Could not update driver path cache: {e}")
+
 
 class WebAutomatorConfig:
     """Configuration wrapper for WebAutomator"""
@@ -35,12 +152,14 @@ class WebAutomatorConfig:
             self.headless = config_dict.get('headless', False)
             self.wait_timeout = config_dict.get('wait_timeout', 10)
             self.max_retries = config_dict.get('max_retries', 3)
+            self.poll_frequency = config_dict.get('poll_frequency', 0.05)
         else:
             # Already a config object
             self.browser = getattr(config_dict, 'browser', 'chrome')
             self.headless = getattr(config_dict, 'headless', False)
             self.wait_timeout = getattr(config_dict, 'wait_timeout', 10)
             self.max_retries = getattr(config_dict, 'max_retries', 3)
+            self.poll_frequency = getattr(config_dict, 'poll_frequency', 0.05)
 
 
 class WebAutomator:
@@ -52,6 +171,15 @@ class WebAutomator:
         self.driver = None
         self.wait = None
         
+    def _wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """Explicit wait polling at config.poll_frequency (Selenium's default is 0.5s)"""
+        return WebDriverWait(
+            self.driver,
+            self.config.wait_timeout if timeout is None else timeout,
+            poll_frequency=self.config.poll_frequency,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
+        
     def _setup_driver(self):
         """Setup WebDriver based on configuration"""
         if self.driver is not None:
@@ -72,7 +200,7 @@ class WebAutomator:
                 options.add_experimental_option('useAutomationExtension', False)
                 
                 if WEBDRIVER_MANAGER_AVAILABLE:
-                    service = ChromeService(ChromeDriverManager().install())
+                    service = ChromeService(install_driver("chrome"))
                     self.driver = webdriver.Chrome(service=service, options=options)
                 else:
                     self.driver = webdriver.Chrome(options=options)
@@ -83,7 +211,7 @@ class WebAutomator:
                     options.add_argument("--headless")
                     
                 if WEBDRIVER_MANAGER_AVAILABLE:
-                    service = FirefoxService(GeckoDriverManager().install())
+                    service = FirefoxService(install_driver("firefox"))
                     self.driver = webdriver.Firefox(service=service, options=options)
                 else:
                     self.driver = webdriver.Firefox(options=options)
@@ -107,7 +235,7 @@ class WebAutomator:
                             options = ChromeOptions()
                             options.add_argument("--no-sandbox")
                             options.add_argument("--disable-dev-shm-usage")
-                            service = ChromeService(ChromeDriverManager().install())
+                            service = ChromeService(install_driver("chrome"))
                             self.driver = webdriver.Chrome(service=service, options=options)
                         else:
                             raise Exception("No suitable browser found")
@@ -116,8 +244,12 @@ class WebAutomator:
                 logger.error(f"Unsupported browser: {browser}")
                 return None
                 
+            # Explicit waits only: an implicit wait would make every polled
+            # find inside WebDriverWait block for the full implicit timeout
+            self.driver.implicitly_wait(0)
+            
             # Setup wait
-            self.wait = WebDriverWait(self.driver, self.config.wait_timeout)
+            self.wait = self._wait()
             
             # Set window size
             self.driver.set_window_size(1920, 1080)
@@ -146,8 +278,9 @@ class WebAutomator:
             logger.debug(f"Navigating to: {url}")
             self.driver.get(url)
             
-            # Wait for page to load
-            self.wait.until(
+            # Wait for page to load - tight poll so a fast page isn't held
+            # back by the default 500ms poll interval
+            self._wait().until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
             
@@ -157,6 +290,62 @@ class WebAutomator:
             logger.error(f"Failed to navigate to {url}: {e}")
             return False
 
+    def wait_for_ready(self, timeout: Optional[int] = None, selector: Optional[str] = None,
+                       network_idle: bool = False, idle_ms: int = 500) -> bool:
+        """
+        Wait until the current page has finished loading
+        
+        Args:
+            timeout: Wait timeout (defaults to config wait_timeout)
+            selector: Optional CSS selector that must also be present
+            network_idle: Also wait until no new resource has finished loading
+                for idle_ms (catches XHR/lazy content after the load event)
+            idle_ms: Quiet period required for network_idle
+            
+        Returns:
+            True if the page is ready within the timeout
+        """
+        try:
+            if not self.driver:
+                return False
+                
+            if timeout is None:
+                timeout = self.config.wait_timeout
+                
+            wait = self._wait(timeout)
+            if network_idle:
+                # One script per poll: [readyState, resource entries so far, page clock]
+                state = {"count": -1, "since": 0.0}
+                
+                def idle(driver):
+                    ready, count, now = driver.execute_script(
+                        "return [document.readyState, "
+                        "performance.getEntriesByType('resource').length, "
+                        "performance.now()];"
+                    )
+                    if ready != "complete" or count != state["count"]:
+                        state["count"], state["since"] = count, now
+                        return False
+                    return now - state["since"] >= idle_ms
+                
+                wait.until(idle)
+            else:
+                wait.until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
+            
+            if selector:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                
+            return True
+            
+        except TimeoutException:
+            logger.debug(f"Page not ready within {timeout}s")
+            return False
+        except Exception as e:
+            logger.error(f"Error waiting for page readiness: {e}")
+            return False
+
     def search(self, query: str, engine: str = "google") -> bool:
         """
         Perform web search
@@ -208,7 +397,7 @@ class WebAutomator:
             if timeout is None:
                 timeout = self.config.wait_timeout
                 
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             element = wait.until(EC.presence_of_element_located((by, selector)))
             
             return element
@@ -242,6 +431,68 @@ class WebAutomator:
             logger.error(f"Error finding elements {selector}: {e}")
             return []
 
+    def count_elements(self, selector: str) -> int:
+        """
+        Count elements matching a CSS selector without transferring them
+        
+        Args:
+            selector: CSS selector
+            
+        Returns:
+            Number of matches (0 on error)
+        """
+        try:
+            if not self.driver:
+                return 0
+                
+            return self.driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", selector
+            )
+            
+        except Exception as e:
+            logger.error(f"Error counting elements {selector}: {e}")
+            return 0
+
+    def count_elements_batch(self, selectors: Dict[str, str]) -> Dict[str, int]:
+        """
+        Count matches for several CSS selectors in one browser evaluation
+        
+        Uses CDP Runtime.evaluate on Chromium (one DevTools call, result returned
+        by value), falling back to a single execute_script elsewhere.
+        
+        Args:
+            selectors: Mapping of label -> CSS selector
+            
+        Returns:
+            Mapping of label -> match count ({} on error)
+        """
+        try:
+            if not self.driver:
+                return {}
+                
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                expression = (
+                    "(s => Object.fromEntries(Object.entries(s).map("
+                    "([k, v]) => [k, document.querySelectorAll(v).length])))"
+                    f"({json.dumps(selectors)})"
+                )
+                result = self.driver.execute_cdp_cmd(
+                    "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+                )
+                if "exceptionDetails" not in result:
+                    return result["result"]["value"]
+                
+            return self.driver.execute_script(
+                "var s = arguments[0], r = {};"
+                "for (var k in s) { r[k] = document.querySelectorAll(s[k]).length; }"
+                "return r;",
+                selectors
+            )
+            
+        except Exception as e:
+            logger.error(f"Error counting elements: {e}")
+            return {}
+
     def click_element(self, selector: str, by: By = By.CSS_SELECTOR) -> bool:
         """
         Click an element
@@ -269,6 +520,84 @@ class WebAutomator:
             logger.error(f"Failed to click element {selector}: {e}")
             return False
 
+    def click_via_js(self, selector: str) -> bool:
+        """
+        Find and click the first element matching a CSS selector in one
+        JavaScript call (avoids separate WebDriver find/wait/click round trips)
+        
+        Args:
+            selector: CSS selector
+            
+        Returns:
+            True if an element was found and clicked
+        """
+        try:
+            if not self.driver:
+                return False
+                
+            clicked = self.driver.execute_script(
+                "const e = document.querySelector(arguments[0]);"
+                "if (e) { e.click(); return true; }"
+                "return false;",
+                selector
+            )
+            
+            if clicked:
+                logger.debug(f"Clicked element via JavaScript: {selector}")
+            else:
+                logger.warning(f"Element not found for clicking: {selector}")
+            return bool(clicked)
+            
+        except Exception as e:
+            logger.error(f"Failed to click element {selector} via JavaScript: {e}")
+            return False
+
+    def preconnect(self, url: Optional[str] = None, link_selector: Optional[str] = None) -> Optional[str]:
+        """
+        Ask the browser to warm up DNS, TCP and TLS for a likely next target
+        
+        Args:
+            url: URL whose origin to warm up
+            link_selector: CSS selector of an element inside the link or form
+                           whose href/action is the next target (used if no url)
+            
+        Returns:
+            The origin being warmed up, or None if no target was found
+        """
+        try:
+            if not self.driver:
+                return None
+                
+            origin = self.driver.execute_script(
+                """
+                let url = arguments[0];
+                if (!url && arguments[1]) {
+                    const el = document.querySelector(arguments[1]);
+                    const target = el && (el.closest('a') || el.closest('form'));
+                    url = target && (target.href || target.action);
+                }
+                if (!url) return null;
+                const origin = new URL(url, location.href).origin;
+                for (const rel of ['dns-prefetch', 'preconnect']) {
+                    const link = document.createElement('link');
+                    link.rel = rel;
+                    link.href = origin;
+                    document.head.appendChild(link);
+                }
+                return origin;
+                """,
+                url,
+                link_selector
+            )
+            
+            if origin:
+                logger.debug(f"Preconnecting to {origin}")
+            return origin
+            
+        except Exception as e:
+            logger.debug(f"Preconnect failed: {e}")
+            return None
+
     def click_element_by_text(self, text: str) -> bool:
         """
         Click element containing specific text
@@ -341,6 +670,10 @@ class WebAutomator:
         """
         Fill form fields
         
+        All fields are located (input, textarea or select, by name or id) and
+        set in a single JavaScript call rather than a find + send_keys round
+        trip per field.
+        
         Args:
             form_data: Dictionary of field_name: value pairs
             
@@ -348,30 +681,37 @@ class WebAutomator:
             True if all fields filled successfully
         """
         try:
-            success_count = 0
-            
-            for field_name, value in form_data.items():
-                # Try different ways to find the form field
-                selectors = [
-                    f"input[name='{field_name}']",
-                    f"input[id='{field_name}']",
-                    f"textarea[name='{field_name}']",
-                    f"textarea[id='{field_name}']",
-                    f"select[name='{field_name}']",
-                    f"select[id='{field_name}']"
-                ]
-                
-                filled = False
-                for selector in selectors:
-                    if self.type_in_element(selector, value):
-                        success_count += 1
-                        filled = True
-                        break
-                        
-                if not filled:
-                    logger.warning(f"Could not fill field: {field_name}")
-            
-            return success_count == len(form_data)
+            if not self.driver:
+                return False
+                
+            missing = self.driver.execute_script(
+                """
+                const missing = [];
+                for (const [name, value] of Object.entries(arguments[0])) {
+                    const n = CSS.escape(name);
+                    const el = document.querySelector(
+                        `input[name='${n}'], input[id='${n}'], ` +
+                        `textarea[name='${n}'], textarea[id='${n}'], ` +
+                        `select[name='${n}'], select[id='${n}']`
+                    );
+                    if (!el) { missing.push(name); continue; }
+                    // The prototype's native setter, so React/Vue value
+                    // tracking sees the change and keeps it
+                    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+                    if (setter && setter.set) { setter.set.call(el, value); } else { el.value = value; }
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                }
+                return missing;
+                """,
+                form_data
+            ) or []
+            
+            for field_name in missing:
+                logger.warning(f"Could not fill field: {field_name}")
+                
+            logger.debug(f"Filled {len(form_data) - len(missing)}/{len(form_data)} form fields")
+            return not missing
             
         except Exception as e:
             logger.error(f"Failed to fill form: {e}")
@@ -464,6 +804,25 @@ class WebAutomator:
             logger.error(f"Failed to get current URL: {e}")
             return ""
 
+    def get_page_info(self) -> Dict[str, str]:
+        """
+        Get the current URL and title together
+        
+        Uses a single CDP Target.getTargetInfo call on Chromium, falling back
+        to the separate current_url/title WebDriver calls elsewhere.
+        
+        Returns:
+            Dict with 'url' and 'title' ("" on error)
+        """
+        if self.driver and hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                target = self.driver.execute_cdp_cmd("Target.getTargetInfo", {})["targetInfo"]
+                return {'url': target["url"], 'title': target["title"]}
+            except Exception as e:
+                logger.debug(f"CDP target info unavailable, using WebDriver: {e}")
+        
+        return {'url': self.get_current_url(), 'title': self.get_page_title()}
+
     def get_page_source(self) -> str:
         """Get page HTML source"""
         try:
@@ -472,21 +831,67 @@ class WebAutomator:
             logger.error(f"Failed to get page source: {e}")
             return ""
 
+    def get_screenshot_bytes(self, image_format: str = "png") -> Optional[bytes]:
+        """
+        Capture the current page as encoded image bytes
+        
+        Args:
+            image_format: "png", or "jpg"/"jpeg" for a JPEG at quality 80
+            
+        Returns:
+            Encoded image bytes, or None on failure
+        """
+        try:
+            if not self.driver:
+                return None
+                
+            jpeg = image_format.lower() in ("jpg", "jpeg")
+            
+            # Chromium: CDP capture is faster than the W3C screenshot endpoint
+            # and does not steal window focus
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                params = {"captureBeyondViewport": False}
+                if jpeg:
+                    params.update({"format": "jpeg", "quality": 80})
+                else:
+                    params["format"] = "png"
+                    
+                result = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)
+                return base64.b64decode(result["data"])
+                
+            png = self.driver.get_screenshot_as_png()
+            if not jpeg:
+                return png
+                
+            # W3C endpoint only returns PNG; re-encode to JPEG
+            from io import BytesIO
+            from PIL import Image
+            out = BytesIO()
+            Image.open(BytesIO(png)).convert("RGB").save(out, "JPEG", quality=80)
+            return out.getvalue()
+            
+        except Exception as e:
+            logger.error(f"Failed to capture screenshot: {e}")
+            return None
+
     def take_screenshot(self, filename: str) -> bool:
         """
         Take screenshot of current page
         
         Args:
-            filename: Path to save screenshot
+            filename: Path to save screenshot (.jpg/.jpeg saves a JPEG, anything else PNG)
             
         Returns:
             True if successful
         """
         try:
-            if not self.driver:
+            data = self.get_screenshot_bytes(os.path.splitext(filename)[1].lstrip("."))
+            if data is None:
                 return False
                 
-            self.driver.save_screenshot(filename)
+            with open(filename, "wb") as f:
+                f.write(data)
+                
             logger.debug(f"Screenshot saved: {filename}")
             return True
             
@@ -511,7 +916,7 @@ class WebAutomator:
             if timeout is None:
                 timeout = self.config.wait_timeout
                 
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.visibility_of_element_located((by, selector)))
             return True
             
@@ -522,12 +927,13 @@ class WebAutomator:
             logger.error(f"Error waiting for element visibility: {e}")
             return False
 
-    def execute_javascript(self, script: str) -> Any:
+    def execute_javascript(self, script: str, *args: Any) -> Any:
         """
         Execute JavaScript on the page
         
         Args:
             script: JavaScript code to execute
+            *args: Values passed to the script as arguments[0], arguments[1], ...
             
         Returns:
             Result of JavaScript execution
@@ -536,7 +942,7 @@ class WebAutomator:
             if not self.driver:
                 return None
                 
-            result = self.driver.execute_script(script)
+            result = self.driver.execute_script(script, *args)
             logger.debug(f"Executed JavaScript: {script[:100]}...")
             return result
             